@@ -1,18 +1,24 @@
 """Application configuration using TOML + environment variables."""
 
 import os
-import tomllib
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Self
 
 from dotenv import load_dotenv
 
+# Prefer the native (Rust) TOML parser from the optional fast-toml extra; without
+# it (e.g. boards with no rtoml wheel, where it would need a Rust build) use stdlib.
+try:
+    import rtoml as _toml
+except ImportError:
+    import tomllib as _toml
+
 # Load .env file for secrets
 load_dotenv()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ServerConfig:
     """Server settings."""
 
@@ -21,23 +27,26 @@ class ServerConfig:
     debug: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PollingConfig:
     """Polling settings."""
 
     interval: float = 3.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SonosConfig:
     """Sonos settings."""
 
     enabled: bool = True
     ip: str = ""
     room: str = ""
+    # Remember the auto-discovered speaker here to skip discovery on restart
+    # (empty disables)
+    cache_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpotifyConfig:
     """Spotify settings."""
 
@@ -50,7 +59,7 @@ class SpotifyConfig:
     client_secret: str = field(default_factory=lambda: os.getenv("SPOTIFY_CLIENT_SECRET", ""))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArtworkConfig:
     """Album artwork settings."""
 
@@ -59,14 +68,38 @@ class ArtworkConfig:
     prefetch_count: int = 5  # Number of upcoming tracks to prefetch
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DisplayConfig:
     """Display/UI settings."""
 
     default_mode: str = "on"  # on, detailed, or off
 
 
-@dataclass
+# Parsed config.toml contents, keyed by path. Each entry remembers the file's
+# (mtime_ns, size) so repeat loads cost one stat() until the file changes.
+_load_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _read_config(config_path: Path) -> dict:
+    """Parse config.toml, reusing the previous parse if the file is unchanged."""
+    try:
+        st = config_path.stat()
+    except FileNotFoundError:
+        return {}
+
+    key = str(config_path)
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _load_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    # rtoml and tomllib share the loads(str) API (load() differs on binary files)
+    data = _toml.loads(config_path.read_text(encoding="utf-8"))
+    _load_cache[key] = (signature, data)
+    return data
+
+
+@dataclass(slots=True, frozen=True)
 class Settings:
     """Application settings loaded from config.toml and environment."""
 
@@ -86,10 +119,7 @@ class Settings:
             if not config_path.exists():
                 config_path = Path(__file__).parent.parent.parent / "config.toml"
 
-        data = {}
-        if config_path.exists():
-            with open(config_path, "rb") as f:
-                data = tomllib.load(f)
+        data = _read_config(config_path)
 
         return cls(
             server=ServerConfig(**data.get("server", {})),
@@ -1,19 +1,20 @@
 """FastAPI application for album art display."""
 
 import asyncio
-import json
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from sse_starlette.sse import EventSourceResponse
 
-from .config import get_settings
-from .services.poller import poller
+from .config import Settings, get_settings
+from .services.poller import get_poller
 from .services.state import playback_state
+from .sources import itunes
 
 # Configure logging
 settings = get_settings()
@@ -30,11 +31,12 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting album art display...")
     logger.info(f"Server: http://{settings.server.host}:{settings.server.port}")
-    await poller.start()
+    await get_poller().start()
     yield
     # Shutdown
     logger.info("Shutting down...")
-    await poller.stop()
+    await get_poller().stop()
+    await itunes.close_client()
 
 
 app = FastAPI(
@@ -48,12 +50,14 @@ app = FastAPI(
 static_path = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_path)), name="static")
 
+# The page never changes while the server runs - read it once, not per request
+index_html = (static_path / "index.html").read_text()
+
 
 @app.get("/", response_class=HTMLResponse)
 async def index():
     """Serve the main display page."""
-    html_path = static_path / "index.html"
-    return HTMLResponse(content=html_path.read_text())
+    return HTMLResponse(content=index_html)
 
 
 @app.get("/api/state")
@@ -71,21 +75,32 @@ async def get_sources():
                 "name": source.name,
                 "available": source.is_available,
             }
-            for source in poller.sources
+            for source in get_poller().sources
         ]
     }
 
 
+# Response for /api/config, built once per Settings instance
+_config_response: tuple[Settings, dict] | None = None
+
+
 @app.get("/api/config")
 async def get_config():
     """Get client-side configuration."""
-    # Use get_settings() to pick up CLI overrides (not module-level settings)
+    global _config_response
+    # Use get_settings() to pick up CLI overrides (not module-level settings).
+    # Settings is frozen, so a new instance is the only way the response changes.
     current_settings = get_settings()
-    return {
-        "display": {
-            "default_mode": current_settings.display.default_mode,
-        }
-    }
+    if _config_response is None or _config_response[0] is not current_settings:
+        _config_response = (
+            current_settings,
+            {
+                "display": {
+                    "default_mode": current_settings.display.default_mode,
+                }
+            },
+        )
+    return _config_response[1]
 
 
 @app.get("/api/stream")
@@ -93,10 +108,19 @@ async def stream(request: Request):
     """SSE endpoint for real-time playback updates."""
 
     async def event_generator():
-        queue: asyncio.Queue = asyncio.Queue()
+        # Only the latest track matters - a slow client skips intermediate
+        # updates instead of letting its queue grow without bound
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
 
         async def on_update(track):
-            await queue.put(track)
+            try:
+                queue.put_nowait(track)
+            except asyncio.QueueFull:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
+                queue.put_nowait(track)
 
         # Subscribe to state changes
         playback_state.subscribe(on_update)
@@ -105,7 +129,7 @@ async def stream(request: Request):
             # Send initial state
             yield {
                 "event": "state",
-                "data": json.dumps(playback_state.to_dict()),
+                "data": orjson.dumps(playback_state.to_dict()).decode(),
             }
 
             while True:
@@ -116,13 +140,11 @@ async def stream(request: Request):
                 try:
                     # Wait for updates with timeout
                     track = await asyncio.wait_for(queue.get(), timeout=30.0)
+                    # Splice in the track's cached JSON rather than re-serializing it
+                    track_json = track.to_json() if track else "null"
                     yield {
                         "event": "update",
-                        "data": json.dumps(
-                            {
-                                "current_track": track.to_dict() if track else None,
-                            }
-                        ),
+                        "data": f'{{"current_track": {track_json}}}',
                     }
                 except asyncio.TimeoutError:
                     # Send keepalive
@@ -136,10 +158,11 @@ async def stream(request: Request):
 def run():
     """Run the application with uvicorn."""
     import argparse
+    from dataclasses import replace
 
     import uvicorn
 
-    from .config import Settings, set_settings
+    from .config import set_settings
 
     parser = argparse.ArgumentParser(description="Album Art Display")
     parser.add_argument(
@@ -154,12 +177,14 @@ def run():
     )
     args = parser.parse_args()
 
-    # Load settings and apply CLI overrides
-    settings = Settings.load()
+    # Reuse the settings already loaded at import and apply CLI overrides
+    settings = get_settings()
     if args.default_mode:
-        settings.display.default_mode = args.default_mode
+        settings = replace(
+            settings, display=replace(settings.display, default_mode=args.default_mode)
+        )
     if args.port:
-        settings.server.port = args.port
+        settings = replace(settings, server=replace(settings.server, port=args.port))
 
     # Store settings so they're available to the app
     set_settings(settings)
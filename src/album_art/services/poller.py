@@ -2,15 +2,27 @@
 
 import asyncio
 import logging
+import time
 
 from ..config import get_settings
 from ..sources.base import MusicSource, TrackInfo
-from ..sources.sonos import SonosSource
-from ..sources.spotify import SpotifySource
 from .state import playback_state
 
 logger = logging.getLogger(__name__)
 
+# Lower rank wins when several sources are playing at once
+_SOURCE_PRIORITY = {"spotify": 0, "sonos": 1}
+
+# Longest wait between availability checks while no source is available (seconds)
+_MAX_IDLE_DELAY = 60.0
+
+# A source whose poll raises or times out twice in a row is skipped for this
+# long (seconds), doubling per further failure, so a broken one isn't hit every
+# tick. A single failure is retried on the next tick: a one-off slow call
+# shouldn't cost the display a tick on top of the one it already lost
+_SOURCE_BACKOFF_BASE = 1.0
+_SOURCE_BACKOFF_CAP = 30.0
+
 
 class Poller:
     """Background service that polls music sources."""
@@ -19,13 +31,23 @@ class Poller:
         self._sources: list[MusicSource] = []
         self._running = False
         self._task: asyncio.Task | None = None
-
-        # Initialize sources
+        # Set by stop() to wake the loop out of its between-poll wait
+        self._stop_event = asyncio.Event()
+        # Per-source backoff by name: consecutive failures, monotonic retry time
+        self._source_failures: dict[str, int] = {}
+        self._source_retry_at: dict[str, float] = {}
+
+        # Initialize sources in priority order. Imported here so a disabled
+        # source never loads its client library (spotipy, soco)
         settings = get_settings()
-        if settings.sonos.enabled:
-            self._sources.append(SonosSource())
         if settings.spotify.enabled:
+            from ..sources.spotify import SpotifySource
+
             self._sources.append(SpotifySource())
+        if settings.sonos.enabled:
+            from ..sources.sonos import SonosSource
+
+            self._sources.append(SonosSource())
 
     @property
     def sources(self) -> list[MusicSource]:
@@ -37,6 +59,7 @@ class Poller:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._task = asyncio.create_task(self._poll_loop())
         available = [s.name for s in self._sources if s.is_available]
         logger.info(f"Poller started with available sources: {available}")
@@ -44,55 +67,148 @@ class Poller:
     async def stop(self):
         """Stop the background polling task."""
         self._running = False
+        self._stop_event.set()
         if self._task:
             self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+            # Wait for it to finish without re-raising its CancelledError here,
+            # so a cancellation of stop()'s own caller isn't swallowed
+            await asyncio.wait({self._task})
             self._task = None
         logger.info("Poller stopped")
 
     async def _poll_loop(self):
         """Main polling loop."""
-        settings = get_settings()
+        # Loop invariant - read once rather than on every tick
+        interval = get_settings().polling.interval
+        loop = asyncio.get_running_loop()
+        backoff = 1
         while self._running:
+            tick_start = loop.time()
+            delay = interval
             try:
-                track = await self._poll_sources()
-                await playback_state.update(track)
+                # Checked once per tick and handed on, rather than again in _poll_sources
+                available = [source for source in self._sources if source.is_available]
+                if available:
+                    backoff = 1
+                    ready = self._ready_sources(available)
+                    # With every source backing off there's nothing to report -
+                    # keep what's showing rather than count it as "no track"
+                    if ready:
+                        # Leave headroom so a stalled source can't push us past the next tick
+                        track = await self._poll_sources(timeout=interval * 0.8, sources=ready)
+                        await playback_state.update(track)
+                else:
+                    # Nothing to poll (e.g. Sonos powered off) - back off until a
+                    # source comes back instead of spinning every interval
+                    await playback_state.update(None)
+                    delay = min(interval * backoff, _MAX_IDLE_DELAY)
+                    backoff *= 2
             except Exception as e:
                 logger.error(f"Polling error: {e}")
 
-            await asyncio.sleep(settings.polling.interval)
-
-    async def _poll_sources(self) -> TrackInfo | None:
-        """Poll all sources and return the best current track."""
-        # Poll all sources concurrently
-        tasks = [source.get_current_track() for source in self._sources if source.is_available]
+            # Wait out the rest of the tick rather than a full interval after the
+            # poll, so slow polls don't make the schedule drift
+            remaining = max(0.0, tick_start + delay - loop.time())
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=remaining)
+                break  # stop() was called
+            except asyncio.TimeoutError:
+                pass
 
-        if not tasks:
+    async def _poll_sources(
+        self, timeout: float | None = None, sources: list[MusicSource] | None = None
+    ) -> TrackInfo | None:
+        """Poll all sources and return the best current track.
+
+        ``sources`` are the already-checked available sources (default: check
+        each one). A source that takes longer than ``timeout`` seconds counts as
+        having no track.
+        Returns as soon as a source is playing and no source still running
+        outranks it; the rest are cancelled.
+        """
+        if sources is None:
+            sources = [source for source in self._sources if source.is_available]
+        sources = self._ready_sources(sources)
+        if not sources:
             return None
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out exceptions and None results
-        tracks = [r for r in results if isinstance(r, TrackInfo)]
-
-        if not tracks:
-            return None
+        # Poll all sources concurrently, each task mapped to its source and rank
+        tasks = {
+            asyncio.create_task(
+                asyncio.wait_for(source.get_current_track(), timeout=timeout)
+            ): (source.name, _SOURCE_PRIORITY.get(source.name, len(_SOURCE_PRIORITY)))
+            for source in sources
+        }
+
+        # Take results as they arrive (exceptions, timeouts and None are skipped).
+        # Prioritize: playing track > any track, Spotify > Sonos (typically higher
+        # quality art); with nothing playing, the most recent paused track wins.
+        best_playing: TrackInfo | None = None
+        best_playing_rank = len(_SOURCE_PRIORITY)
+        latest_paused: TrackInfo | None = None
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    name, rank = tasks[task]
+                    if task.cancelled():
+                        continue
+                    if task.exception() is not None:
+                        self._source_failed(name, task.exception())
+                        continue
+                    if name in self._source_failures:
+                        del self._source_failures[name]
+                        del self._source_retry_at[name]
+                    r = task.result()
+                    if not isinstance(r, TrackInfo):
+                        continue
+                    if r.is_playing:
+                        if best_playing is None or rank < best_playing_rank:
+                            best_playing, best_playing_rank = r, rank
+                    elif latest_paused is None or r.timestamp > latest_paused.timestamp:
+                        latest_paused = r
+                # Stop waiting once no source still running could outrank what's playing
+                if best_playing is not None and all(
+                    tasks[task][1] >= best_playing_rank for task in pending
+                ):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return best_playing or latest_paused
+
+    def _ready_sources(self, sources: list[MusicSource]) -> list[MusicSource]:
+        """Drop the sources that are still backing off."""
+        if not self._source_retry_at:
+            return sources
+        now = time.monotonic()
+        return [s for s in sources if self._source_retry_at.get(s.name, 0.0) <= now]
+
+    def _source_failed(self, name: str, exc: BaseException) -> None:
+        """Back off from a source whose poll raised or timed out again."""
+        failures = self._source_failures.get(name, 0) + 1
+        self._source_failures[name] = failures
+        if failures == 1:
+            self._source_retry_at[name] = time.monotonic()
+            logger.warning(f"Polling {name} failed ({exc!r}), retrying next tick")
+            return
+        delay = min(_SOURCE_BACKOFF_CAP, _SOURCE_BACKOFF_BASE * 2 ** (failures - 2))
+        self._source_retry_at[name] = time.monotonic() + delay
+        logger.warning(f"Polling {name} failed ({exc!r}), skipping it for {delay:.0f}s")
 
-        # Prioritize: playing track > any track, Spotify > Sonos (typically higher quality art)
-        playing_tracks = [t for t in tracks if t.is_playing]
-        if playing_tracks:
-            # Prefer Spotify for higher quality art
-            for t in playing_tracks:
-                if t.source == "spotify":
-                    return t
-            return playing_tracks[0]
 
-        # Nothing playing, return most recent paused track
-        return max(tracks, key=lambda t: t.timestamp)
+# Global poller instance - created lazily so importing this module doesn't
+# load settings or set up sources
+_poller: Poller | None = None
 
 
-# Global singleton
-poller = Poller()
+def get_poller() -> Poller:
+    """Get the global poller instance."""
+    global _poller
+    if _poller is None:
+        _poller = Poller()
+    return _poller
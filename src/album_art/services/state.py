@@ -1,6 +1,7 @@
 """Playback state management."""
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Awaitable, Callable
@@ -13,13 +14,18 @@ class PlaybackState:
     """Current playback state across all sources."""
 
     current_track: TrackInfo | None = None
-    last_updated: datetime = field(default_factory=datetime.now)
+    last_updated: float = field(default_factory=time.time)  # Unix time
 
-    # Subscribers for state changes
-    _subscribers: list[Callable[[TrackInfo | None], Awaitable[None]]] = field(
-        default_factory=list, repr=False
+    # Subscribers for state changes. A dict used as an insertion-ordered set:
+    # O(1) subscribe/unsubscribe, and keying on the callback itself (rather than
+    # id()) keeps bound methods working, since each access creates a new object.
+    _subscribers: dict[Callable[[TrackInfo | None], Awaitable[None]], None] = field(
+        default_factory=dict, repr=False
     )
 
+    # In-flight notification tasks (see update())
+    _notify_tasks: set[asyncio.Task] = field(default_factory=set, repr=False)
+
     # Grace period for transient disconnects - don't flash "Nothing Playing"
     # on brief network hiccups. Only clear track after consecutive None results.
     _consecutive_none_count: int = field(default=0, repr=False)
@@ -27,15 +33,19 @@ class PlaybackState:
 
     def subscribe(self, callback: Callable[[TrackInfo | None], Awaitable[None]]):
         """Subscribe to state changes."""
-        self._subscribers.append(callback)
+        self._subscribers[callback] = None
 
     def unsubscribe(self, callback: Callable[[TrackInfo | None], Awaitable[None]]):
         """Unsubscribe from state changes."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
+        self._subscribers.pop(callback, None)
 
     async def update(self, track: TrackInfo | None):
         """Update the current track and notify subscribers."""
+        # Fast path: same instance, or still nothing playing - nothing to compare
+        if track is self.current_track:
+            self._consecutive_none_count = 0
+            return
+
         # Grace period: don't immediately clear track on transient None
         # This prevents jarring "Nothing Playing" flash on brief network hiccups
         if track is None and self.current_track is not None:
@@ -52,13 +62,16 @@ class PlaybackState:
             return
 
         self.current_track = track
-        self.last_updated = datetime.now()
+        self.last_updated = time.time()
 
-        # Notify all subscribers
-        await asyncio.gather(
-            *[self._safe_notify(callback, track) for callback in self._subscribers],
-            return_exceptions=True,
-        )
+        # Notify subscribers without waiting on them, so a slow client can't
+        # stall the poll loop (_safe_notify already swallows their errors)
+        for callback in self._subscribers:
+            task = asyncio.create_task(self._safe_notify(callback, track))
+            # The event loop only keeps weak references to tasks - hold one
+            # until the notification finishes so it isn't collected mid-flight
+            self._notify_tasks.add(task)
+            task.add_done_callback(self._notify_tasks.discard)
 
     async def _safe_notify(
         self, callback: Callable[[TrackInfo | None], Awaitable[None]], track: TrackInfo | None
@@ -71,23 +84,15 @@ class PlaybackState:
 
     def _tracks_equal(self, a: TrackInfo | None, b: TrackInfo | None) -> bool:
         """Check if two tracks are the same (ignoring position/timestamp)."""
-        if a is None and b is None:
-            return True
         if a is None or b is None:
-            return False
-        return (
-            a.source == b.source
-            and a.title == b.title
-            and a.artist == b.artist
-            and a.album == b.album
-            and a.is_playing == b.is_playing
-        )
+            return a is b
+        return a.identity == b.identity
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
         return {
             "current_track": self.current_track.to_dict() if self.current_track else None,
-            "last_updated": self.last_updated.isoformat(),
+            "last_updated": datetime.fromtimestamp(self.last_updated).isoformat(),
         }
 
 
@@ -1,11 +1,42 @@
 """Abstract base class for music sources."""
 
+import sys
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import orjson
 
-@dataclass
+
+@dataclass(slots=True)
+class QueueItem:
+    """An upcoming queue entry with both Sonos and iTunes artwork (debug/comparison modes)."""
+
+    sonos_url: str  # Original Sonos artwork URL
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+    itunes_url: str | None = None  # iTunes high-res URL (if found)
+    has_itunes_match: bool = False
+    display_url: str = ""  # The URL to actually display (iTunes if available, else Sonos)
+    reason: str = ""  # Why iTunes was/wasn't used (e.g., "matched", "no match")
+
+    def to_dict(self) -> dict:
+        """Convert to JSON-serializable dict."""
+        return {
+            "sonos_url": self.sonos_url,
+            "itunes_url": self.itunes_url,
+            "title": self.title,
+            "artist": self.artist,
+            "album": self.album,
+            "has_itunes_match": self.has_itunes_match,
+            "display_url": self.display_url,
+            "reason": self.reason,
+        }
+
+
+@dataclass(slots=True)
 class TrackInfo:
     """Normalized track information from any source."""
 
@@ -17,7 +48,8 @@ class TrackInfo:
     is_playing: bool
     position_ms: int | None = None
     duration_ms: int | None = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Unix time (float) - cheaper than datetime.now(); formatted only in to_dict()
+    timestamp: float = field(default_factory=time.time)
     # For high-res art lookup
     art_source: str = "sonos"  # "sonos", "spotify", or "itunes"
     # Why this art source was chosen (e.g., "matched", "no match", "rate limited")
@@ -29,9 +61,23 @@ class TrackInfo:
     # For comparison mode: original Sonos URL when iTunes is used
     original_sonos_art_url: str | None = None
     # Enhanced queue items with both Sonos and iTunes URLs (for debug mode)
-    upcoming_queue_items: list[dict] = field(default_factory=list)
+    upcoming_queue_items: list[QueueItem] = field(default_factory=list)
     # Whether queue has items
     queue_in_use: bool = False
+    # Fields that define "the same track" (ignores position/timestamp/art),
+    # precomputed so change detection is a single tuple compare
+    identity: tuple = field(init=False, repr=False, compare=False)
+    # Serialized to_dict() output, built on first use (tracks aren't mutated after polling)
+    _json: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # These only ever take a handful of values; interning makes the
+        # per-poll copies (e.g. f-string "cached (...)" reasons) share one object
+        # and lets equality checks short-circuit on identity
+        self.source = sys.intern(self.source)
+        self.art_source = sys.intern(self.art_source)
+        self.art_source_reason = sys.intern(self.art_source_reason)
+        self.identity = (self.source, self.title, self.artist, self.album, self.is_playing)
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
@@ -44,16 +90,22 @@ class TrackInfo:
             "is_playing": self.is_playing,
             "position_ms": self.position_ms,
             "duration_ms": self.duration_ms,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
             "art_source": self.art_source,
             "art_source_reason": self.art_source_reason,
             "upcoming_art_urls": self.upcoming_art_urls,
             "room_name": self.room_name,
             "original_sonos_art_url": self.original_sonos_art_url,
-            "upcoming_queue_items": self.upcoming_queue_items,
+            "upcoming_queue_items": [item.to_dict() for item in self.upcoming_queue_items],
             "queue_in_use": self.queue_in_use,
         }
 
+    def to_json(self) -> str:
+        """Return to_dict() as a JSON string, cached on the instance."""
+        if self._json is None:
+            self._json = orjson.dumps(self.to_dict()).decode()
+        return self._json
+
 
 class MusicSource(ABC):
     """Abstract base class for music source integrations."""
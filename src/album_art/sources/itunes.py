@@ -1,16 +1,32 @@
 """iTunes Search API for high-resolution album artwork."""
 
+import asyncio
+import functools
 import logging
+import random
 import re
 import time
 
 import httpx
+import orjson
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Common edition/version markers in parentheses or brackets, matched in one pass
+_EDITION_RE = re.compile(
+    r"\s*(?:"
+    r"\([^)]*(?:edition|deluxe|remaster|bonus|anniversary|version)[^)]*\)"
+    r"|\[[^\]]*(?:edition|deluxe|remaster|bonus|anniversary|version)[^\]]*\]"
+    r")",
+    re.IGNORECASE,
+)
 
+
+# Album titles repeat across polls and queue items; the result only depends
+# on the title
+@functools.lru_cache(maxsize=4096)
 def _clean_album_name(album: str) -> str:
     """Strip edition markers that confuse iTunes search.
 
@@ -19,25 +35,70 @@ def _clean_album_name(album: str) -> str:
     wrong results (e.g., "Charlie Brown Christmas (Expanded Edition)"
     instead of "Filter - Title Of Record (Expanded Edition)").
     """
-    # Remove common edition/version markers in parentheses or brackets
-    patterns = [
-        r"\s*\([^)]*(?:edition|deluxe|remaster|bonus|anniversary|version)[^)]*\)",
-        r"\s*\[[^\]]*(?:edition|deluxe|remaster|bonus|anniversary|version)[^\]]*\]",
-    ]
-    cleaned = album
-    for pattern in patterns:
-        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
-    return cleaned.strip()
-
-# Simple in-memory cache for iTunes lookups
-# Stores {"url": str | None, "reason": str} for each cache key
-_artwork_cache: dict[str, dict] = {}
+    # Most titles have no brackets at all - skip the regex for them
+    if "(" not in album and "[" not in album:
+        return album.strip()
+    return _EDITION_RE.sub("", album).strip()
+
+# Simple in-memory LRU cache for iTunes lookups
+# Stores {"url": str | None, "reason": str, "expires": float} per casefolded
+# (artist, album) key.
+# Relies on dict insertion order: hits are re-inserted at the end, the oldest
+# entry is evicted.
+_artwork_cache: dict[tuple[str, str], dict] = {}
+_CACHE_MAX = 4096
+
+# Matches are stable; misses expire sooner so newly added albums get picked up
+_CACHE_TTL_MATCHED = 30 * 24 * 3600  # 30 days
+_CACHE_TTL_NEGATIVE = 3600  # 1 hour
+
+# Lookups currently in progress, so concurrent misses for the same album
+# share one request instead of each hitting the API (also keeps strong refs,
+# since a search carries on after every caller waiting on it is cancelled)
+_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+# Background refreshes of expired entries, by cache key (also keeps strong
+# refs so the tasks aren't garbage collected mid-flight)
+_refresh_tasks: dict[tuple[str, str], asyncio.Task] = {}
 
 # Reusable client for connection pooling
 _http_client: httpx.AsyncClient | None = None
 
+# Caps concurrent searches - a fresh queue can fan out into many misses at once
+_MAX_CONCURRENT_SEARCHES = 5
+_request_slots = asyncio.Semaphore(_MAX_CONCURRENT_SEARCHES)
+
+_SEARCH_URL = "https://itunes.apple.com/search"
+# Fixed part of every search query
+_SEARCH_PARAMS = {
+    "entity": "album",
+    "limit": 5,  # Get multiple results to find best match
+}
+
 # Rate limit backoff - unix timestamp when we can retry
 _rate_limit_until: float = 0
+# Consecutive 429s since the last successful response (drives the backoff)
+_rate_limit_attempts: int = 0
+_RATE_LIMIT_BASE = 30.0  # seconds
+_RATE_LIMIT_CAP = 600.0  # seconds
+
+
+def _cache_result(cache_key: tuple[str, str], url: str | None, reason: str) -> None:
+    """Store a lookup result, evicting the least recently used entry if full."""
+    ttl = _CACHE_TTL_MATCHED if url else _CACHE_TTL_NEGATIVE
+    _artwork_cache[cache_key] = {
+        "url": url,
+        "reason": reason,
+        "expires": time.monotonic() + ttl,
+    }
+    if len(_artwork_cache) > _CACHE_MAX:
+        del _artwork_cache[next(iter(_artwork_cache))]
+
+
+@functools.lru_cache(maxsize=4)
+def _size_token(size: int) -> str:
+    """Artwork URL size segment, e.g. "1200x1200bb" (size is fixed by config)."""
+    return f"{size}x{size}bb"
 
 
 def _get_client() -> httpx.AsyncClient:
@@ -45,12 +106,25 @@ def _get_client() -> httpx.AsyncClient:
     global _http_client
     if _http_client is None:
         _http_client = httpx.AsyncClient(
+            # HTTP/2 multiplexes the parallel queue lookups over one TLS connection
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=4, max_connections=8, keepalive_expiry=60.0
+            ),
             timeout=httpx.Timeout(10.0, connect=15.0),
             follow_redirects=True,
         )
     return _http_client
 
 
+async def close_client() -> None:
+    """Close the shared HTTP client (on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 async def get_itunes_artwork(artist: str, album: str) -> tuple[str | None, str]:
     """Look up high-res album art from iTunes Search API.
 
@@ -63,18 +137,58 @@ async def get_itunes_artwork(artist: str, album: str) -> tuple[str | None, str]:
         Reasons: "matched", "no match", "not found", "rate limited",
                  "timeout", "http error", "error", "disabled", "cached (X)"
     """
-    global _rate_limit_until
-
-    settings = get_settings()
-    if not settings.artwork.prefer_itunes:
+    artwork = get_settings().artwork
+    if not artwork.prefer_itunes:
         return None, "disabled"
 
     # Build cache key - check cache first (even during rate limit)
-    cache_key = f"{artist}|{album}".lower().strip()
-    if cache_key in _artwork_cache:
-        cached = _artwork_cache[cache_key]
+    # casefold() rather than lower() so e.g. "ß" and "SS" share an entry
+    # A tuple rather than a joined string, so "a|b" + "c" and "a" + "b|c" differ
+    cache_key = (artist.casefold().strip(), album.casefold().strip())
+    cached = _artwork_cache.pop(cache_key, None)
+    if cached is not None:
+        _artwork_cache[cache_key] = cached  # Mark as most recently used
+        if cached["expires"] <= time.monotonic() and cache_key not in _refresh_tasks:
+            # Stale-while-revalidate: answer from the old entry now and refresh
+            # it in the background, so expiry never stalls a poll. A refresh
+            # that fails (rate limited, timeout) leaves the old entry in place.
+            task = asyncio.create_task(
+                _lookup(artist, album, cache_key, artwork.itunes_size)
+            )
+            _refresh_tasks[cache_key] = task
+            task.add_done_callback(lambda _: _refresh_tasks.pop(cache_key, None))
         return cached["url"], f"cached ({cached['reason']})"
 
+    # Another caller is already looking this album up - share its result
+    inflight = _inflight.get(cache_key)
+    if inflight is not None:
+        # shield() so a cancelled waiter doesn't cancel the shared search
+        return await asyncio.shield(inflight)
+
+    return await _lookup(artist, album, cache_key, artwork.itunes_size)
+
+
+async def _lookup(
+    artist: str, album: str, cache_key: tuple[str, str], size: int
+) -> tuple[str | None, str]:
+    """Run _search_itunes as its own task, publishing it in _inflight for concurrent callers.
+
+    The caller only waits on it through shield(), so a poll that's cancelled
+    mid-search (e.g. outranked by a faster source) doesn't throw away a request
+    that's already been sent - the search still finishes and caches its result.
+    """
+    task = asyncio.create_task(_search_itunes(artist, album, cache_key, size))
+    _inflight[cache_key] = task
+    task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+    return await asyncio.shield(task)
+
+
+async def _search_itunes(
+    artist: str, album: str, cache_key: tuple[str, str], size: int
+) -> tuple[str | None, str]:
+    """Query the iTunes Search API and cache the outcome (see get_itunes_artwork)."""
+    global _rate_limit_until, _rate_limit_attempts
+
     # Check if we're in rate limit backoff (only applies to new lookups)
     if time.time() < _rate_limit_until:
         logger.debug("iTunes rate limited, skipping lookup")
@@ -88,71 +202,79 @@ async def get_itunes_artwork(artist: str, album: str) -> tuple[str | None, str]:
 
     try:
         client = _get_client()
-        resp = await client.get(
-            "https://itunes.apple.com/search",
-            params={
-                "term": query,
-                "entity": "album",
-                "limit": 5,  # Get multiple results to find best match
-            },
-        )
+        async with _request_slots:
+            resp = await client.get(_SEARCH_URL, params={"term": query, **_SEARCH_PARAMS})
         resp.raise_for_status()
-        data = resp.json()
+        _rate_limit_attempts = 0
+        data = orjson.loads(resp.content)
 
         results = data.get("results", [])
         if not results:
             logger.debug(f"No iTunes results for '{query}'")
-            _artwork_cache[cache_key] = {"url": None, "reason": "not found"}
+            _cache_result(cache_key, None, "not found")
             return None, "not found"
 
         # Find best matching result - verify BOTH artist AND album match
         artist_lower = artist.lower()
         album_lower = clean_album.lower()
 
+        # Lowercase each result once; skip ones with empty artist/album or no art
+        candidates = []
         for result in results:
             result_artist = result.get("artistName", "").lower()
             result_album = result.get("collectionName", "").lower()
+            if result_artist and result_album and result.get("artworkUrl100"):
+                candidates.append((result_artist, result_album, result))
+
+        # Exact match is the common case - check it before the containment scans
+        match = next(
+            (r for ra, rb, r in candidates if ra == artist_lower and rb == album_lower), None
+        )
+        if match is None:
+            # Allow partial matches: "The Band" vs "Band", editions/remasters
+            match = next(
+                (
+                    r
+                    for ra, rb, r in candidates
+                    if (artist_lower in ra or ra in artist_lower)
+                    and (album_lower in rb or rb in album_lower)
+                ),
+                None,
+            )
+
+        if match is not None:
+            # Replace 100x100 with configured size for higher resolution
+            # iTunes supports sizes up to 3000x3000
+            high_res_url = match["artworkUrl100"].replace("100x100bb", _size_token(size))
+            logger.info(f"iTunes match: '{match.get('collectionName')}' {size}x{size}")
+            _cache_result(cache_key, high_res_url, "matched")
+            return high_res_url, "matched"
 
-            # Skip results with empty artist or album
-            if not result_artist or not result_album:
-                continue
-
-            # Check if artist name matches (allow partial match for "The Band" vs "Band")
-            artist_match = artist_lower in result_artist or result_artist in artist_lower
-
-            # Check if album name matches (allow partial match for editions/remasters)
-            album_match = album_lower in result_album or result_album in album_lower
-
-            if artist_match and album_match:
-                art_url = result.get("artworkUrl100", "")
-                if art_url:
-                    # Replace 100x100 with configured size for higher resolution
-                    # iTunes supports sizes up to 3000x3000
-                    size = settings.artwork.itunes_size
-                    high_res_url = art_url.replace("100x100bb", f"{size}x{size}bb")
-                    logger.info(
-                        f"iTunes match: '{result.get('collectionName')}' {size}x{size}"
-                    )
-                    _artwork_cache[cache_key] = {"url": high_res_url, "reason": "matched"}
-                    return high_res_url, "matched"
-
-        # Log which albums were found but didn't match
-        found_albums = [r.get("collectionName") for r in results if r.get("collectionName")]
-        logger.debug(f"No iTunes match for '{query}' - albums found: {found_albums}")
-        _artwork_cache[cache_key] = {"url": None, "reason": "no album match"}
+        # Log which albums were found but didn't match (only built when it'll be shown)
+        if logger.isEnabledFor(logging.DEBUG):
+            found_albums = [r.get("collectionName") for r in results if r.get("collectionName")]
+            logger.debug(f"No iTunes match for '{query}' - albums found: {found_albums}")
+        _cache_result(cache_key, None, "no album match")
         return None, "no album match"
 
     except httpx.TimeoutException:
         logger.warning(f"iTunes lookup timed out for '{query}'")
         return None, "timeout"
     except httpx.HTTPStatusError as e:
-        if e.response.status_code == 429:
-            # Rate limited - back off for 60 seconds
-            _rate_limit_until = time.time() + 60
-            logger.warning("iTunes rate limited (429), backing off for 60s")
+        status = e.response.status_code
+        if status in (403, 429):
+            # Rate limited (iTunes answers 403 when throttling, too) - full-jitter
+            # exponential backoff, so repeated hits don't line every retry up
+            # on the same schedule
+            delay = random.uniform(
+                0, min(_RATE_LIMIT_CAP, _RATE_LIMIT_BASE * 2**_rate_limit_attempts)
+            )
+            _rate_limit_attempts += 1
+            _rate_limit_until = time.time() + delay
+            logger.warning(f"iTunes rate limited ({status}), backing off for {delay:.0f}s")
             return None, "rate limited"
         else:
-            logger.warning(f"iTunes HTTP error for '{query}': {e.response.status_code}")
+            logger.warning(f"iTunes HTTP error for '{query}': {status}")
             return None, "http error"
     except Exception as e:
         logger.warning(f"iTunes lookup failed for '{query}': {e}")
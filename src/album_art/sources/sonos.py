@@ -1,17 +1,48 @@
 """Sonos integration using SoCo library."""
 
 import asyncio
+import concurrent.futures
+import dataclasses
+import functools
+import json
 import logging
+import operator
+import time
+from pathlib import Path
 
 import soco
 from soco import SoCo
 
 from ..config import get_settings
-from .base import MusicSource, TrackInfo
+from .base import MusicSource, QueueItem, TrackInfo
 from .itunes import get_itunes_artwork
 
 logger = logging.getLogger(__name__)
 
+# Own pool for blocking SoCo calls, so a stalled speaker can't starve the
+# default executor shared with Spotify and everything else
+_SONOS_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="sonos"
+)
+
+# Speakers on a LAN answer discovery within ~0.5s; only wait longer if none did.
+# The fallback keeps the old 5s reach for slow networks - it runs in the background
+_DISCOVERY_TIMEOUTS = (0.5, 5.0)
+
+# Placeholders for tracks that report no artist/album (e.g. radio, line-in);
+# never worth an iTunes lookup
+_UNKNOWN_ARTIST = "Unknown Artist"
+_UNKNOWN_ALBUM = "Unknown Album"
+
+# Most queue lookups in flight at once for one poll (current track's is separate)
+_QUEUE_LOOKUP_CONCURRENCY = 3
+
+# Queue item fields read per entry: (artwork, title, artist, album)
+_QUEUE_ATTRS = operator.attrgetter("album_art_uri", "title", "creator", "album")
+
+# iTunes outcomes worth retrying on the next poll rather than keeping for the track
+_TRANSIENT_REASONS = frozenset({"rate limited", "timeout", "http error", "error"})
+
 
 class SonosSource(MusicSource):
     """Sonos music source using SoCo library."""
@@ -19,7 +50,20 @@ class SonosSource(MusicSource):
     def __init__(self):
         self._device: SoCo | None = None
         self._room_name: str | None = None
-        self._discovery_attempted = False
+        # "http://<ip>:1400" - prefix for the relative art paths the speaker returns
+        self._base_url: str | None = None
+        # Discovery blocks for seconds, so it runs once in the background on the
+        # Sonos pool rather than inside a (timed) poll
+        self._discovery: asyncio.Future | None = None
+        # (current track key, queue) from the last fetch - the queue rarely
+        # changes mid-track, so get_queue is only re-run when the track does
+        self._queue_cache: tuple[tuple[str, str], list] | None = None
+        # Last fully resolved track (art + queue) and the key it was built for,
+        # so polls within the same track only refresh the volatile fields
+        self._last_track: TrackInfo | None = None
+        self._last_track_key: tuple | None = None
+        # Transport state seen on the previous poll, to spot paused -> playing
+        self._was_playing: bool | None = None
 
     @property
     def name(self) -> str:
@@ -27,26 +71,31 @@ class SonosSource(MusicSource):
 
     @property
     def is_available(self) -> bool:
-        settings = get_settings()
-        if not settings.sonos.enabled:
+        if not get_settings().sonos.enabled:
             return False
         return self._get_device() is not None
 
     def _get_device(self) -> SoCo | None:
-        """Get or discover Sonos device."""
-        if self._device is not None:
-            return self._device
+        """Get Sonos device, starting discovery in the background if needed.
 
-        if self._discovery_attempted:
-            return None
+        Returns None until discovery has found it.
+        """
+        if self._device is None and self._discovery is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return None  # No loop to run it from - the next call on one starts it
+            self._discovery = loop.run_in_executor(_SONOS_EXECUTOR, self._find_device)
+        return self._device
 
-        self._discovery_attempted = True
-        settings = get_settings()
+    def _find_device(self) -> SoCo | None:
+        """Connect to the configured, cached or discovered Sonos device (blocking)."""
+        sonos = get_settings().sonos
 
         # Try specific IP first
-        if settings.sonos.ip:
+        if sonos.ip:
             try:
-                device = SoCo(settings.sonos.ip)
+                device = SoCo(sonos.ip)
                 # Verify it's actually a Sonos device by checking required attributes
                 # This will fail if the IP points to a non-Sonos device
                 player_name = device.player_name
@@ -54,108 +103,198 @@ class SonosSource(MusicSource):
                 _ = device.uid  # Unique ID - only Sonos devices have this
                 self._device = device
                 self._room_name = player_name
-                logger.info(f"Connected to Sonos '{player_name}' at {settings.sonos.ip}")
+                logger.info(f"Connected to Sonos '{player_name}' at {sonos.ip}")
                 return self._device
             except Exception as e:
                 logger.warning(
-                    f"Device at {settings.sonos.ip} is not a valid Sonos speaker: {e}"
+                    f"Device at {sonos.ip} is not a valid Sonos speaker: {e}"
                 )
 
+        # Reuse the speaker found by discovery on a previous run, if still there
+        if sonos.cache_path:
+            device = self._load_cached_device(sonos.cache_path, sonos.room)
+            if device is not None:
+                return device
+
         # Auto-discover
         try:
             logger.info("Discovering Sonos devices...")
-            devices = list(soco.discover(timeout=5) or [])
+            devices = []
+            for timeout in _DISCOVERY_TIMEOUTS:
+                devices = list(soco.discover(timeout=timeout) or [])
+                if devices:
+                    break
             if not devices:
                 logger.warning("No Sonos devices found")
                 return None
 
             # Filter by room name if specified
-            if settings.sonos.room:
+            # player_name is a network round-trip per access - read it once per device
+            if sonos.room:
+                room = sonos.room.lower()
                 for device in devices:
-                    if device.player_name.lower() == settings.sonos.room.lower():
+                    player_name = device.player_name
+                    if player_name.lower() == room:
                         self._device = device
-                        self._room_name = device.player_name
-                        logger.info(f"Connected to Sonos: {device.player_name}")
+                        self._room_name = player_name
+                        logger.info(f"Connected to Sonos: {player_name}")
+                        self._save_cached_device(sonos.cache_path)
                         return self._device
-                logger.warning(f"Room '{settings.sonos.room}' not found")
+                logger.warning(f"Room '{sonos.room}' not found")
 
             # Use first device found
             self._device = devices[0]
             self._room_name = self._device.player_name
-            logger.info(f"Connected to Sonos: {self._device.player_name}")
+            logger.info(f"Connected to Sonos: {self._room_name}")
+            self._save_cached_device(sonos.cache_path)
             return self._device
         except Exception as e:
             logger.error(f"Sonos discovery failed: {e}")
             return None
 
+    def _load_cached_device(self, cache_path: str, room: str) -> SoCo | None:
+        """Reconnect to a previously discovered speaker, checking it's still the same one."""
+        try:
+            cached = json.loads(Path(cache_path).expanduser().read_text())
+            if room and cached["room"].lower() != room.lower():
+                return None  # Room filter changed since the speaker was cached
+            device = SoCo(cached["ip"])
+            # A single request to the speaker - far cheaper than multicast discovery
+            if device.uid != cached["uid"]:
+                logger.info(f"Cached Sonos at {cached['ip']} is a different speaker now")
+                return None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring Sonos discovery cache: {e}")
+            return None
+
+        self._device = device
+        self._room_name = cached["room"]
+        logger.info(f"Connected to Sonos '{cached['room']}' at {cached['ip']} (cached)")
+        return device
+
+    def _save_cached_device(self, cache_path: str) -> None:
+        """Remember the discovered speaker for the next run."""
+        if not cache_path or self._device is None:
+            return
+        try:
+            path = Path(cache_path).expanduser()
+            # Write then rename, so a crash mid-write can't leave a torn file
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(
+                json.dumps(
+                    {
+                        "ip": self._device.ip_address,
+                        "uid": self._device.uid,
+                        "room": self._room_name,
+                    }
+                )
+            )
+            tmp.replace(path)
+        except Exception as e:
+            logger.debug(f"Could not write Sonos discovery cache: {e}")
+
     async def get_current_track(self) -> TrackInfo | None:
         """Get currently playing track from Sonos."""
         device = self._get_device()
         if device is None:
             return None
 
-        settings = get_settings()
+        artwork = get_settings().artwork
 
         # Run blocking SoCo calls in thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         try:
-            track_info = await loop.run_in_executor(None, device.get_current_track_info)
-            transport_info = await loop.run_in_executor(None, device.get_current_transport_info)
+            # Independent UPnP round-trips - overlap them on the thread pool
+            track_info, transport_info = await asyncio.gather(
+                loop.run_in_executor(_SONOS_EXECUTOR, device.get_current_track_info),
+                loop.run_in_executor(_SONOS_EXECUTOR, device.get_current_transport_info),
+            )
         except Exception as e:
             logger.error(f"Error getting Sonos track info: {e}")
             # Reset device to retry discovery next time
             self._device = None
             self._room_name = None
-            self._discovery_attempted = False
+            self._base_url = None
+            self._discovery = None
+            self._queue_cache = None
+            self._last_track = None
+            self._was_playing = None
             return None
 
         # Check if actually playing
         playback_state = transport_info.get("current_transport_state", "")
         is_playing = playback_state == "PLAYING"
+        resumed = is_playing and self._was_playing is False
+        self._was_playing = is_playing
 
         title = track_info.get("title", "")
         if not title:
             return None
 
-        artist = track_info.get("artist", "") or "Unknown Artist"
-        album = track_info.get("album", "") or "Unknown Album"
+        artist = track_info.get("artist", "") or _UNKNOWN_ARTIST
+        album = track_info.get("album", "") or _UNKNOWN_ALBUM
 
         # Construct full album art URL from Sonos
         album_art = track_info.get("album_art", "")
         if album_art and not album_art.startswith("http"):
-            album_art = f"http://{device.ip_address}:1400{album_art}"
+            if self._base_url is None:
+                self._base_url = f"http://{device.ip_address}:1400"
+            album_art = self._base_url + album_art
+
+        position_ms = self._parse_time(track_info.get("position", ""))
+        track_key = (title, artist, album, track_info.get("playlist_position", ""))
+        last = self._last_track
+        # Resuming playback re-resolves too, in case the queue was edited while paused
+        if resumed:
+            self._queue_cache = None
+        elif last is not None and self._last_track_key == track_key:
+            return dataclasses.replace(
+                last, is_playing=is_playing, position_ms=position_ms, timestamp=time.time()
+            )
 
         art_source = "sonos"
         art_source_reason = ""
         original_sonos_url = album_art  # Save for comparison mode
 
-        # Try to get higher-res art from iTunes
-        if settings.artwork.prefer_itunes:
-            itunes_art, reason = await get_itunes_artwork(artist, album)
+        # Get enhanced queue items with iTunes lookups for debug/comparison modes
+        queue_items = self._get_enhanced_queue_items(
+            device,
+            artwork.prefetch_count,
+            artwork.prefer_itunes,
+            (track_info.get("uri", ""), track_info.get("playlist_position", "")),
+        )
+
+        # Try to get higher-res art from iTunes - independent of the queue
+        # fetch, so run both at once
+        if not artwork.prefer_itunes:
+            enhanced_queue_items = await queue_items
+            art_source_reason = "disabled"
+        elif artist == _UNKNOWN_ARTIST or album == _UNKNOWN_ALBUM:
+            enhanced_queue_items = await queue_items
+            art_source_reason = "no metadata"
+        else:
+            (itunes_art, reason), enhanced_queue_items = await asyncio.gather(
+                get_itunes_artwork(artist, album), queue_items
+            )
             art_source_reason = reason
             if itunes_art:
                 album_art = itunes_art
                 art_source = "itunes"
                 logger.debug(f"Using iTunes artwork for '{title}' ({reason})")
-        else:
-            art_source_reason = "disabled"
-
-        # Get enhanced queue items with iTunes lookups for debug/comparison modes
-        enhanced_queue_items = await self._get_enhanced_queue_items(
-            device, settings.artwork.prefetch_count, settings.artwork.prefer_itunes
-        )
 
         # Extract display URLs for backward-compatible prefetching
-        upcoming_art_urls = [item["display_url"] for item in enhanced_queue_items]
+        upcoming_art_urls = [item.display_url for item in enhanced_queue_items if item.display_url]
 
-        return TrackInfo(
+        track = TrackInfo(
             source=self.name,
             title=title,
             artist=artist,
             album=album,
             album_art_url=album_art or None,
             is_playing=is_playing,
-            position_ms=self._parse_time(track_info.get("position", "")),
+            position_ms=position_ms,
             duration_ms=self._parse_time(track_info.get("duration", "")),
             art_source=art_source,
             art_source_reason=art_source_reason,
@@ -166,76 +305,127 @@ class SonosSource(MusicSource):
             queue_in_use=len(enhanced_queue_items) > 0,
         )
 
+        # Only reuse results that won't improve on retry
+        transient = art_source_reason in _TRANSIENT_REASONS or any(
+            item.reason in _TRANSIENT_REASONS for item in enhanced_queue_items
+        )
+        self._last_track = None if transient else track
+        self._last_track_key = track_key
+        return track
+
     async def _get_enhanced_queue_items(
-        self, device: SoCo, count: int, prefer_itunes: bool
-    ) -> list[dict]:
-        """Get queue items with both Sonos and iTunes URLs for debug/comparison modes.
-
-        Returns list of dicts with:
-        - sonos_url: Original Sonos artwork URL
-        - itunes_url: iTunes high-res URL (if found)
-        - title, artist, album: Track metadata
-        - has_itunes_match: Whether iTunes art was found
-        - display_url: The URL to actually display (iTunes if available, else Sonos)
-        - reason: Why iTunes was/wasn't used (e.g., "matched", "no match", "rate limited")
-        """
+        self, device: SoCo, count: int, prefer_itunes: bool, track_key: tuple[str, str]
+    ) -> list[QueueItem]:
+        """Get queue items with both Sonos and iTunes URLs for debug/comparison modes."""
         if count <= 0:
             return []
 
-        loop = asyncio.get_event_loop()
-        try:
-            queue = await loop.run_in_executor(
-                None,
-                lambda: device.get_queue(max_items=count, full_album_art_uri=True),
-            )
-        except Exception as e:
-            logger.debug(f"Could not fetch queue: {e}")
-            return []
+        # Same track as last poll (and a URI to tell) - skip the UPnP round-trip
+        if track_key[0] and self._queue_cache and self._queue_cache[0] == track_key:
+            queue = self._queue_cache[1]
+        else:
+            try:
+                queue = await asyncio.get_running_loop().run_in_executor(
+                    _SONOS_EXECUTOR,
+                    functools.partial(
+                        device.get_queue, max_items=count, full_album_art_uri=True
+                    ),
+                )
+            except Exception as e:
+                logger.debug(f"Could not fetch queue: {e}")
+                self._queue_cache = None
+                return []
+            self._queue_cache = (track_key, queue) if track_key[0] else None
 
         # Build list of queue items with metadata
         items = []
+        reason = "disabled" if not prefer_itunes else ""
         for item in queue:
-            sonos_url = getattr(item, "album_art_uri", None) or ""
-            items.append({
-                "sonos_url": sonos_url,
-                "itunes_url": None,
-                "title": getattr(item, "title", "") or "",
-                "artist": getattr(item, "creator", "") or "",
-                "album": getattr(item, "album", "") or "",
-                "has_itunes_match": False,
-                "display_url": sonos_url,
-                "reason": "disabled" if not prefer_itunes else "",
-            })
-
-        # Do iTunes lookups in parallel if enabled
+            try:
+                sonos_url, title, artist, album = _QUEUE_ATTRS(item)
+            except AttributeError:
+                # Not every DIDL item carries all fields (e.g. radio, some streams)
+                sonos_url = getattr(item, "album_art_uri", None)
+                title = getattr(item, "title", None)
+                artist = getattr(item, "creator", None)
+                album = getattr(item, "album", None)
+            sonos_url = sonos_url or ""
+            items.append(
+                QueueItem(
+                    sonos_url=sonos_url,
+                    title=title or "",
+                    artist=artist or "",
+                    album=album or "",
+                    display_url=sonos_url,
+                    reason=reason,
+                )
+            )
+
+        # Do iTunes lookups in parallel if enabled - once per distinct album, as
+        # a queue often holds several tracks from the same one
         if prefer_itunes and items:
-            async def lookup_itunes(item: dict) -> None:
-                """Look up iTunes art for a single queue item."""
-                if item["artist"] and item["album"]:
-                    itunes_url, reason = await get_itunes_artwork(item["artist"], item["album"])
-                    item["reason"] = reason
-                    if itunes_url:
-                        item["itunes_url"] = itunes_url
-                        item["has_itunes_match"] = True
-                        item["display_url"] = itunes_url
-                else:
-                    item["reason"] = "no metadata"
-
-            await asyncio.gather(*[lookup_itunes(item) for item in items])
+            albums = list(
+                {(item.artist, item.album) for item in items if item.artist and item.album}
+            )
+            results: dict[tuple[str, str], tuple[str | None, str]] = {}
+            slots = asyncio.Semaphore(_QUEUE_LOOKUP_CONCURRENCY)
+
+            async def lookup(artist: str, album: str) -> None:
+                async with slots:
+                    try:
+                        results[artist, album] = await get_itunes_artwork(artist, album)
+                    except Exception as e:
+                        # Keep one bad lookup from failing the whole queue
+                        logger.debug(f"iTunes lookup failed for '{artist} - {album}': {e}")
+                        results[artist, album] = None, "error"
+
+            async with asyncio.TaskGroup() as tg:
+                for artist, album in albums:
+                    tg.create_task(lookup(artist, album))
+            for item in items:
+                result = results.get((item.artist, item.album))
+                if result is None:
+                    item.reason = "no metadata"
+                    continue
+                itunes_url, item.reason = result
+                if itunes_url:
+                    item.itunes_url = itunes_url
+                    item.has_itunes_match = True
+                    item.display_url = itunes_url
 
         return items
 
     @staticmethod
-    def _parse_time(time_str: str) -> int | None:
+    def _parse_time(time_str: str | None) -> int | None:
         """Parse time string (H:MM:SS or M:SS) to milliseconds."""
         if not time_str:
             return None
-        parts = time_str.split(":")
-        try:
-            if len(parts) == 3:
-                return (int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])) * 1000
-            elif len(parts) == 2:
-                return (int(parts[0]) * 60 + int(parts[1])) * 1000
-        except ValueError:
-            return None
+        return _parse_time_cached(time_str)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_time_cached(time_str: str) -> int | None:
+    """Memoized body of SonosSource._parse_time.
+
+    Duration is the same on every poll of a track, so it is almost always a hit.
+    """
+    # Single pass over the characters - no split() list or int() per field.
+    # Each ':' shifts the fields left, so "M:SS" and "H:MM:SS" share one path.
+    hours = minutes = seconds = 0
+    colons = 0
+    digits = 0  # digits seen in the current field
+    for ch in time_str:
+        if ch == ":":
+            if not digits:
+                return None
+            hours, minutes, seconds = minutes, seconds, 0
+            colons += 1
+            digits = 0
+        elif "0" <= ch <= "9":
+            seconds = seconds * 10 + (ord(ch) - 48)
+            digits += 1
+        else:
+            return None  # e.g. "NOT_IMPLEMENTED" for streams
+    if not digits or colons not in (1, 2):
         return None
+    return (hours * 3600 + minutes * 60 + seconds) * 1000
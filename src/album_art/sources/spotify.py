@@ -1,7 +1,9 @@
 """Spotify integration using Spotipy library."""
 
 import asyncio
+import concurrent.futures
 import logging
+import time
 from pathlib import Path
 
 import spotipy
@@ -12,6 +14,25 @@ from .base import MusicSource, TrackInfo
 
 logger = logging.getLogger(__name__)
 
+# Own pool for blocking Spotipy calls, kept apart from the Sonos one
+_SPOTIFY_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="spotify"
+)
+
+# Refresh the access token this many seconds before it expires, alongside a poll,
+# instead of letting Spotipy refresh it inline (and serially) during one. Spotipy
+# refreshes inline once under a minute is left - stay well clear of that window,
+# so the two never refresh (and write the token cache) at the same time.
+_TOKEN_REFRESH_MARGIN = 300
+_SPOTIPY_REFRESH_MARGIN = 60
+
+# After a failed refresh, wait this long before trying again (seconds) -
+# Spotipy still refreshes on demand meanwhile
+_TOKEN_REFRESH_RETRY_DELAY = 300
+
+# How long to trust the last token-cache existence check (seconds)
+_TOKEN_FILE_CHECK_TTL = 5.0
+
 
 class SpotifySource(MusicSource):
     """Spotify music source using Spotipy library."""
@@ -21,6 +42,10 @@ class SpotifySource(MusicSource):
     def __init__(self):
         self._client: spotipy.Spotify | None = None
         self._auth_manager: SpotifyOAuth | None = None
+        self._token_expires_at: float = 0.0
+        # (monotonic time checked, token cache exists) - is_available runs every
+        # poll, and the file only appears once after spotify-auth.py
+        self._token_file_check: tuple[float, bool] | None = None
 
     @property
     def name(self) -> str:
@@ -35,7 +60,11 @@ class SpotifySource(MusicSource):
             logger.debug("Spotify credentials not configured")
             return False
         # Check if we have cached credentials
-        if not Path(settings.spotify.cache_path).exists():
+        now = time.monotonic()
+        check = self._token_file_check
+        if check is None or now - check[0] >= _TOKEN_FILE_CHECK_TTL:
+            check = self._token_file_check = (now, Path(settings.spotify.cache_path).exists())
+        if not check[1]:
             logger.debug("Spotify token cache not found - run spotify-auth.py first")
             return False
         return True
@@ -65,6 +94,7 @@ class SpotifySource(MusicSource):
                 logger.warning("No Spotify token cache found")
                 return None
 
+            self._token_expires_at = token_info.get("expires_at", 0)
             self._client = spotipy.Spotify(auth_manager=self._auth_manager)
             logger.info("Spotify client initialized")
             return self._client
@@ -72,6 +102,28 @@ class SpotifySource(MusicSource):
             logger.error(f"Failed to initialize Spotify client: {e}")
             return None
 
+    def _refresh_token(self) -> None:
+        """Refresh the access token if it's about to expire (runs on the executor)."""
+        try:
+            # Spotipy may already have refreshed it during an earlier call
+            token_info = self._auth_manager.cache_handler.get_cached_token()
+            remaining = token_info["expires_at"] - time.time() if token_info else 0
+            # Inside Spotipy's window the concurrent current_playback refreshes it
+            if token_info and _SPOTIPY_REFRESH_MARGIN <= remaining < _TOKEN_REFRESH_MARGIN:
+                token_info = self._auth_manager.refresh_access_token(
+                    token_info["refresh_token"]
+                )
+                logger.debug("Spotify access token refreshed")
+            if token_info:
+                self._token_expires_at = token_info["expires_at"]
+        except Exception as e:
+            logger.warning(f"Spotify token refresh failed: {e}")
+            # Don't retry every poll - pretend expiry is far enough off that
+            # the next refresh falls due after the retry delay
+            self._token_expires_at = (
+                time.time() + _TOKEN_REFRESH_MARGIN + _TOKEN_REFRESH_RETRY_DELAY
+            )
+
     async def get_current_track(self) -> TrackInfo | None:
         """Get currently playing track from Spotify."""
         client = self._get_client()
@@ -79,9 +131,12 @@ class SpotifySource(MusicSource):
             return None
 
         # Run blocking Spotipy calls in thread pool
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        calls = [loop.run_in_executor(_SPOTIFY_EXECUTOR, client.current_playback)]
+        if self._token_expires_at - time.time() < _TOKEN_REFRESH_MARGIN:
+            calls.append(loop.run_in_executor(_SPOTIFY_EXECUTOR, self._refresh_token))
         try:
-            playback = await loop.run_in_executor(None, client.current_playback)
+            playback, *_ = await asyncio.gather(*calls)
         except Exception as e:
             logger.error(f"Error getting Spotify playback: {e}")
             # Token might be expired, clear client to retry
@@ -108,16 +163,12 @@ class SpotifySource(MusicSource):
             album = item.get("album", {}).get("name", "Unknown Album")
             images = item.get("album", {}).get("images", [])
 
-        # Get highest resolution image (first in list is largest)
+        # Get highest resolution image (usually 640x640). Spotify lists the
+        # largest first, but pick by width rather than rely on the order; some
+        # podcast images have a null width.
         album_art_url = None
         if images:
-            # Prefer 640x640, fall back to largest available
-            for img in images:
-                if img.get("width", 0) >= 640:
-                    album_art_url = img.get("url")
-                    break
-            if not album_art_url and images:
-                album_art_url = images[0].get("url")
+            album_art_url = max(images, key=lambda img: img.get("width") or 0).get("url")
 
         return TrackInfo(
             source=self.name,
@@ -1,11 +1,14 @@
 """Shared test fixtures and configuration."""
 
 import asyncio
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from album_art.config import (
@@ -16,6 +19,7 @@ from album_art.config import (
     SonosConfig,
     SpotifyConfig,
 )
+from album_art.sources import itunes
 from album_art.sources.base import TrackInfo
 
 
@@ -80,60 +84,199 @@ def test_settings_no_itunes() -> Settings:
     )
 
 
+# Every module that binds get_settings at import time
+SETTINGS_PATCH_TARGETS = (
+    "album_art.config.get_settings",
+    "album_art.sources.sonos.get_settings",
+    "album_art.sources.itunes.get_settings",
+    "album_art.services.poller.get_settings",
+)
+
+
+@contextmanager
+def patched_settings(settings: Settings):
+    """Patch every SETTINGS_PATCH_TARGETS entry to return settings."""
+    with ExitStack() as stack:
+        for target in SETTINGS_PATCH_TARGETS:
+            stack.enter_context(patch(target, return_value=settings))
+        yield settings
+
+
 @pytest.fixture
 def mock_settings(test_settings):
     """Patch get_settings to return test settings."""
-    with patch("album_art.config.get_settings", return_value=test_settings):
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch("album_art.sources.itunes.get_settings", return_value=test_settings):
-                with patch("album_art.services.poller.get_settings", return_value=test_settings):
-                    yield test_settings
+    with patched_settings(test_settings):
+        yield test_settings
 
 
 @pytest.fixture
 def mock_settings_no_itunes(test_settings_no_itunes):
     """Patch get_settings with iTunes disabled."""
-    with patch("album_art.config.get_settings", return_value=test_settings_no_itunes):
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings_no_itunes):
-            with patch("album_art.sources.itunes.get_settings", return_value=test_settings_no_itunes):
-                yield test_settings_no_itunes
+    with patched_settings(test_settings_no_itunes):
+        yield test_settings_no_itunes
+
+
+class FakeSoCo:
+    """Stand-in SoCo speaker with canned track, transport and queue responses.
+
+    Set a response to an exception to make that call raise it, as a dropped
+    connection would, or to a callable to compute it on each call.
+    """
+
+    ip_address = "192.168.1.100"
+    player_name = "Living Room"
+    uid = "RINCON_12345"
+
+    def __init__(self):
+        self.track_info = {
+            "title": "Test Song",
+            "artist": "Test Artist",
+            "album": "Test Album",
+            "album_art": "/getaa?s=1&u=sonos://album",
+            "position": "1:00",
+            "duration": "3:00",
+        }
+        self.transport_info = {"current_transport_state": "PLAYING"}
+        self.queue = []
+        self.queue_calls = 0
+
+    def get_current_track_info(self):
+        return self._answer(self.track_info)
+
+    def get_current_transport_info(self):
+        return self._answer(self.transport_info)
+
+    def get_queue(self, *args, **kwargs):
+        self.queue_calls += 1
+        return self._answer(self.queue)
+
+    @staticmethod
+    def _answer(response):
+        if isinstance(response, Exception):
+            raise response
+        return response() if callable(response) else response
 
 
 @pytest.fixture
 def mock_soco_device():
-    """Create a mock SoCo device."""
-    device = MagicMock()
-    device.ip_address = "192.168.1.100"
-    device.player_name = "Living Room"
-    device.uid = "RINCON_12345"
-    device.get_current_track_info.return_value = {
-        "title": "Test Song",
-        "artist": "Test Artist",
-        "album": "Test Album",
-        "album_art": "/getaa?s=1&u=sonos://album",
-        "position": "1:00",
-        "duration": "3:00",
-    }
-    device.get_current_transport_info.return_value = {
-        "current_transport_state": "PLAYING"
-    }
-    device.get_queue.return_value = []
-    return device
+    """Create a fake SoCo device."""
+    return FakeSoCo()
 
 
-class MockQueueItem:
-    """Mock Sonos queue item."""
+def _queue_item(album_art_uri: str | None) -> SimpleNamespace:
+    """Build a Sonos queue entry carrying the DIDL fields SonosSource reads."""
+    return SimpleNamespace(
+        album_art_uri=album_art_uri, title="Next Song", creator="Test Artist", album="Next Album"
+    )
 
-    def __init__(self, album_art_uri: str | None = None):
-        self.album_art_uri = album_art_uri
+
+# Read-only, so shared by every test rather than rebuilt per test
+_QUEUE_ITEMS = (
+    _queue_item("http://192.168.1.100:1400/next1.jpg"),
+    _queue_item("http://192.168.1.100:1400/next2.jpg"),
+    _queue_item(None),  # Item without art
+    _queue_item("http://192.168.1.100:1400/next3.jpg"),
+)
 
 
 @pytest.fixture
 def mock_queue_items():
-    """Create mock queue items with album art."""
-    return [
-        MockQueueItem("http://192.168.1.100:1400/next1.jpg"),
-        MockQueueItem("http://192.168.1.100:1400/next2.jpg"),
-        MockQueueItem(None),  # Item without art
-        MockQueueItem("http://192.168.1.100:1400/next3.jpg"),
-    ]
+    """Mock queue items with album art."""
+    return _QUEUE_ITEMS
+
+
+@pytest.fixture(autouse=True)
+def reset_itunes_state():
+    """Give each test an empty iTunes cache, no client and no rate-limit backoff.
+
+    Single-flight lookups and background refreshes a test leaves behind are
+    cancelled, so they can't finish into a later test on the shared loop.
+    """
+    saved = (
+        itunes._artwork_cache,
+        itunes._inflight,
+        itunes._refresh_tasks,
+        itunes._http_client,
+        itunes._rate_limit_until,
+        itunes._rate_limit_attempts,
+    )
+    itunes._artwork_cache = {}
+    itunes._inflight = {}
+    itunes._refresh_tasks = {}
+    itunes._http_client = None
+    itunes._rate_limit_until = 0
+    itunes._rate_limit_attempts = 0
+    yield
+    for pending in (*itunes._inflight.values(), *itunes._refresh_tasks.values()):
+        pending.cancel()
+    (
+        itunes._artwork_cache,
+        itunes._inflight,
+        itunes._refresh_tasks,
+        itunes._http_client,
+        itunes._rate_limit_until,
+        itunes._rate_limit_attempts,
+    ) = saved
+
+
+class FakeITunesAPI:
+    """Canned iTunes Search API, served to a real httpx client via MockTransport.
+
+    Outcomes are keyed by search term, with None as the fallback for any term.
+    An outcome is an httpx.Response, or an exception the transport raises.
+    """
+
+    def __init__(self):
+        self.outcomes: dict[str | None, httpx.Response | Exception] = {}
+        self.requests: list[httpx.Request] = []
+        # Seconds each search takes, so concurrent callers overlap
+        self.latency = 0.0
+        # Searches being served right now, and the most seen at once
+        self.active = 0
+        self.peak_active = 0
+
+    def respond(
+        self,
+        results: list[dict] | None = None,
+        *,
+        status_code: int = 200,
+        content: bytes | None = None,
+        term: str | None = None,
+    ) -> None:
+        """Answer searches with the given results (or raw content / status)."""
+        if content is not None:
+            response = httpx.Response(status_code, content=content)
+        else:
+            response = httpx.Response(status_code, json={"results": results or []})
+        self.outcomes[term] = response
+
+    def fail(self, exc: Exception, *, term: str | None = None) -> None:
+        """Make searches raise exc, as a network failure would."""
+        self.outcomes[term] = exc
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+        finally:
+            self.active -= 1
+        term = request.url.params.get("term")
+        outcome = self.outcomes.get(term, self.outcomes.get(None))
+        if outcome is None:
+            raise AssertionError(f"Unexpected iTunes search: {term!r}")
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+async def itunes_api():
+    """Route get_itunes_artwork's requests to a FakeITunesAPI."""
+    api = FakeITunesAPI()
+    client = httpx.AsyncClient(transport=httpx.MockTransport(api.handle))
+    with patch.object(itunes, "_http_client", client):
+        yield api
+    await client.aclose()
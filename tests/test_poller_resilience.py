@@ -9,14 +9,17 @@ These tests verify the polling service handles:
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
 from album_art.services.poller import Poller
 from album_art.services.state import PlaybackState
+from album_art.sources import itunes
 from album_art.sources.base import MusicSource, TrackInfo
+from album_art.sources.sonos import SonosSource
 
 
 class MockMusicSource(MusicSource):
@@ -54,7 +57,7 @@ def make_track(
     source: str,
     title: str = "Test Song",
     is_playing: bool = True,
-    timestamp: datetime | None = None,
+    timestamp: float | None = None,
 ) -> TrackInfo:
     """Helper to create test tracks."""
     return TrackInfo(
@@ -64,15 +67,46 @@ def make_track(
         album="Test Album",
         album_art_url="http://example.com/art.jpg",
         is_playing=is_playing,
-        timestamp=timestamp or datetime.now(),
+        timestamp=timestamp or time.time(),
     )
 
 
+def make_settings(interval: float = 1.0) -> SimpleNamespace:
+    """Settings stub with both sources disabled - only what the poller reads."""
+    return SimpleNamespace(
+        polling=SimpleNamespace(interval=interval),
+        sonos=SimpleNamespace(enabled=False),
+        spotify=SimpleNamespace(enabled=False),
+    )
+
+
+async def cancel_and_wait(task: asyncio.Task) -> None:
+    """Cancel a task and wait for it to finish without raising CancelledError."""
+    task.cancel()
+    await asyncio.wait({task})
+
+
+@pytest.fixture
+def bare_poller():
+    """Build a Poller over the given sources, skipping settings-driven __init__."""
+
+    def make(sources: list[MusicSource], running: bool = False) -> Poller:
+        poller = Poller.__new__(Poller)
+        poller._sources = sources
+        poller._running = running
+        poller._task = None
+        poller._stop_event = asyncio.Event()
+        poller._source_failures = {}
+        poller._source_retry_at = {}
+        return poller
+
+    return make
+
+
 class TestPollerSourceFailures:
     """Test poller handling of source failures."""
 
-    @pytest.mark.asyncio
-    async def test_all_sources_fail_with_exceptions(self):
+    async def test_all_sources_fail_with_exceptions(self, bare_poller):
         """Test behavior when all sources throw exceptions."""
         mock_sonos = MockMusicSource(
             "sonos", available=True, exception=RuntimeError("Connection failed")
@@ -81,32 +115,24 @@ class TestPollerSourceFailures:
             "spotify", available=True, exception=TimeoutError("Timeout")
         )
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is None
         assert mock_sonos._call_count == 1
         assert mock_spotify._call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_all_sources_return_none(self):
+    async def test_all_sources_return_none(self, bare_poller):
         """Test behavior when all sources return None (no playback)."""
         mock_sonos = MockMusicSource("sonos", available=True, track=None)
         mock_spotify = MockMusicSource("spotify", available=True, track=None)
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_one_source_fails_other_succeeds(self):
+    async def test_one_source_fails_other_succeeds(self, bare_poller):
         """Test successful source used when another fails."""
         track = make_track("sonos")
         mock_sonos = MockMusicSource("sonos", available=True, track=track)
@@ -114,43 +140,57 @@ class TestPollerSourceFailures:
             "spotify", available=True, exception=RuntimeError("Auth failed")
         )
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is not None
         assert result.source == "sonos"
         assert result.title == "Test Song"
 
-    @pytest.mark.asyncio
-    async def test_unavailable_sources_not_polled(self):
+    async def test_failing_source_backed_off_until_it_recovers(self, bare_poller):
+        """Test a source that raised is skipped for a while, then retried."""
+        mock_sonos = MockMusicSource("sonos", available=True, track=make_track("sonos"))
+        mock_spotify = MockMusicSource(
+            "spotify", available=True, exception=RuntimeError("Auth failed")
+        )
+
+        poller = bare_poller([mock_sonos, mock_spotify])
+
+        for _ in range(5):
+            result = await poller._poll_sources()
+            assert result.source == "sonos"
+        # A first failure is retried next poll; after the second, Spotify backs off
+        assert mock_spotify._call_count == 2
+        assert mock_sonos._call_count == 5
+
+        # Once the backoff has passed and it answers again, the backoff is cleared
+        poller._source_retry_at["spotify"] = 0.0
+        mock_spotify._exception = None
+        mock_spotify._track = make_track("spotify")
+        result = await poller._poll_sources()
+        assert result.source == "spotify"
+        assert poller._source_failures == {}
+        assert poller._source_retry_at == {}
+
+    async def test_unavailable_sources_not_polled(self, bare_poller):
         """Test that unavailable sources are skipped."""
         track = make_track("sonos")
         mock_sonos = MockMusicSource("sonos", available=True, track=track)
         mock_spotify = MockMusicSource("spotify", available=False, track=None)
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is not None
         # Unavailable source should not be called
         assert mock_spotify._call_count == 0
 
-    @pytest.mark.asyncio
-    async def test_no_available_sources(self):
+    async def test_no_available_sources(self, bare_poller):
         """Test behavior when no sources are available."""
         mock_sonos = MockMusicSource("sonos", available=False)
         mock_spotify = MockMusicSource("spotify", available=False)
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is None
@@ -161,8 +201,7 @@ class TestPollerSourceFailures:
 class TestPollerSourcePrioritization:
     """Test poller's source prioritization logic."""
 
-    @pytest.mark.asyncio
-    async def test_playing_preferred_over_paused(self):
+    async def test_playing_preferred_over_paused(self, bare_poller):
         """Test that playing tracks are preferred over paused ones."""
         playing_track = make_track("spotify", is_playing=True)
         paused_track = make_track("sonos", is_playing=False)
@@ -170,18 +209,14 @@ class TestPollerSourcePrioritization:
         mock_sonos = MockMusicSource("sonos", available=True, track=paused_track)
         mock_spotify = MockMusicSource("spotify", available=True, track=playing_track)
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is not None
         assert result.is_playing is True
         assert result.source == "spotify"
 
-    @pytest.mark.asyncio
-    async def test_spotify_preferred_for_higher_quality_art(self):
+    async def test_spotify_preferred_for_higher_quality_art(self, bare_poller):
         """Test Spotify preferred when both are playing (higher quality art)."""
         sonos_track = make_track("sonos", title="Sonos Track", is_playing=True)
         spotify_track = make_track("spotify", title="Spotify Track", is_playing=True)
@@ -189,20 +224,16 @@ class TestPollerSourcePrioritization:
         mock_sonos = MockMusicSource("sonos", available=True, track=sonos_track)
         mock_spotify = MockMusicSource("spotify", available=True, track=spotify_track)
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is not None
         assert result.source == "spotify"
 
-    @pytest.mark.asyncio
-    async def test_most_recent_paused_track_selected(self):
+    async def test_most_recent_paused_track_selected(self, bare_poller):
         """Test most recent paused track selected when nothing playing."""
-        older_time = datetime.now() - timedelta(minutes=5)
-        newer_time = datetime.now()
+        older_time = time.time() - 300  # 5 minutes ago
+        newer_time = time.time()
 
         older_track = make_track("sonos", is_playing=False, timestamp=older_time)
         newer_track = make_track("spotify", is_playing=False, timestamp=newer_time)
@@ -210,10 +241,7 @@ class TestPollerSourcePrioritization:
         mock_sonos = MockMusicSource("sonos", available=True, track=older_track)
         mock_spotify = MockMusicSource("spotify", available=True, track=newer_track)
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
         result = await poller._poll_sources()
         assert result is not None
@@ -224,13 +252,12 @@ class TestPollerSourcePrioritization:
 class TestPollerLoopResilience:
     """Test poller loop continues despite errors."""
 
-    @pytest.mark.asyncio
-    async def test_poll_loop_continues_after_exception(self):
+    async def test_poll_loop_continues_after_exception(self, bare_poller):
         """Test polling loop continues after source exception."""
         poll_count = 0
         exception_on_poll = 2  # Fail on second poll
 
-        async def mock_poll_sources():
+        async def mock_poll_sources(timeout=None, sources=None):
             nonlocal poll_count
             poll_count += 1
             if poll_count == exception_on_poll:
@@ -238,14 +265,10 @@ class TestPollerLoopResilience:
             return make_track("sonos")
 
         # Create poller
-        poller = Poller.__new__(Poller)
-        poller._sources = []
-        poller._running = True
-        poller._task = None
+        poller = bare_poller([MockMusicSource("sonos", available=True)], running=True)
 
         # Mock settings for fast polling
-        mock_settings = MagicMock()
-        mock_settings.polling.interval = 0.01  # Very fast for test
+        mock_settings = make_settings(interval=0.01)  # Very fast for test
 
         # Create state to track updates
         state = PlaybackState()
@@ -258,7 +281,7 @@ class TestPollerLoopResilience:
         state.subscribe(count_updates)
 
         with patch("album_art.services.poller.get_settings", return_value=mock_settings):
-            with patch.object(poller, "_poll_sources", side_effect=mock_poll_sources):
+            with patch.object(poller, "_poll_sources", new=mock_poll_sources):
                 with patch("album_art.services.poller.playback_state", state):
                     # Start polling
                     poller._task = asyncio.create_task(poller._poll_loop())
@@ -268,23 +291,18 @@ class TestPollerLoopResilience:
 
                     # Stop
                     poller._running = False
-                    poller._task.cancel()
-                    try:
-                        await poller._task
-                    except asyncio.CancelledError:
-                        pass
+                    await cancel_and_wait(poller._task)
 
         # Should have polled multiple times despite exception
         assert poll_count >= 3
         # Updates should have happened before and after the error
         assert update_count >= 1
 
-    @pytest.mark.asyncio
-    async def test_poll_loop_handles_state_update_failure(self):
+    async def test_poll_loop_handles_state_update_failure(self, bare_poller):
         """Test polling continues even if state update fails."""
         poll_count = 0
 
-        async def mock_poll_sources():
+        async def mock_poll_sources(timeout=None, sources=None):
             nonlocal poll_count
             poll_count += 1
             return make_track("sonos", title=f"Track {poll_count}")
@@ -292,45 +310,210 @@ class TestPollerLoopResilience:
         async def failing_update(track):
             raise RuntimeError("Update failed")
 
-        mock_settings = MagicMock()
-        mock_settings.polling.interval = 0.01
+        mock_settings = make_settings(interval=0.01)
 
         state = PlaybackState()
         state.subscribe(failing_update)
 
-        poller = Poller.__new__(Poller)
-        poller._sources = []
-        poller._running = True
-        poller._task = None
+        poller = bare_poller([MockMusicSource("sonos", available=True)], running=True)
 
         with patch("album_art.services.poller.get_settings", return_value=mock_settings):
-            with patch.object(poller, "_poll_sources", side_effect=mock_poll_sources):
+            with patch.object(poller, "_poll_sources", new=mock_poll_sources):
                 with patch("album_art.services.poller.playback_state", state):
                     poller._task = asyncio.create_task(poller._poll_loop())
                     await asyncio.sleep(0.05)
                     poller._running = False
-                    poller._task.cancel()
-                    try:
-                        await poller._task
-                    except asyncio.CancelledError:
-                        pass
+                    await cancel_and_wait(poller._task)
 
         # Polling should continue despite subscriber failure
         assert poll_count >= 2
 
+    async def test_poll_loop_backs_off_without_available_sources(self, bare_poller):
+        """Test loop skips polling and backs off while no source is available."""
+        mock_sonos = MockMusicSource("sonos", available=False)
+
+        mock_settings = make_settings(interval=0.01)
+
+        state = PlaybackState()
+        state.current_track = make_track("sonos")
+
+        poller = bare_poller([mock_sonos], running=True)
+
+        with patch("album_art.services.poller.get_settings", return_value=mock_settings):
+            with patch.object(poller, "_poll_sources") as mock_poll_sources:
+                with patch("album_art.services.poller.playback_state", state):
+                    poller._task = asyncio.create_task(poller._poll_loop())
+                    # Waits of 0.01, 0.02, 0.04... - enough for the grace period
+                    await asyncio.sleep(0.1)
+                    poller._running = False
+                    poller._stop_event.set()
+                    await poller._task
+
+        mock_poll_sources.assert_not_called()
+        assert mock_sonos._call_count == 0
+        # Track cleared once the None grace period ran out
+        assert state.current_track is None
+
+    async def test_one_timeout_keeps_current_track(self, bare_poller):
+        """Test a single stalled poll doesn't run out the None grace period."""
+        poll_count = 0
+
+        async def stalls_once():
+            nonlocal poll_count
+            poll_count += 1
+            if poll_count == 2:
+                await asyncio.sleep(1)  # well past the 0.04s poll timeout
+            return make_track("sonos")
+
+        mock_sonos = MockMusicSource("sonos", available=True)
+        mock_sonos.get_current_track = stalls_once
+
+        state = PlaybackState()
+        notified: list[TrackInfo | None] = []
+
+        async def record(track):
+            notified.append(track)
+
+        state.subscribe(record)
+
+        poller = bare_poller([mock_sonos], running=True)
+
+        with patch("album_art.services.poller.get_settings", return_value=make_settings(0.05)):
+            with patch("album_art.services.poller.playback_state", state):
+                poller._task = asyncio.create_task(poller._poll_loop())
+                await asyncio.sleep(0.3)
+                poller._running = False
+                poller._stop_event.set()
+                await poller._task
+        await asyncio.sleep(0)
+
+        assert poll_count > 3
+        assert state.current_track is not None
+        assert None not in notified
+        assert poller._source_failures == {}
+
+    async def test_sources_all_backing_off_keeps_current_track(self, bare_poller):
+        """Test a tick with every source in backoff doesn't report "no track"."""
+        mock_sonos = MockMusicSource("sonos", available=True)
+
+        state = PlaybackState()
+        state.current_track = make_track("sonos")
+
+        poller = bare_poller([mock_sonos], running=True)
+        poller._source_failures["sonos"] = 2
+        poller._source_retry_at["sonos"] = time.monotonic() + 60
+
+        with patch("album_art.services.poller.get_settings", return_value=make_settings(0.01)):
+            with patch("album_art.services.poller.playback_state", state):
+                poller._task = asyncio.create_task(poller._poll_loop())
+                await asyncio.sleep(0.05)
+                poller._running = False
+                poller._stop_event.set()
+                await poller._task
+
+        assert mock_sonos._call_count == 0
+        assert state.current_track is not None
+
+    async def test_availability_checked_once_per_tick(self, bare_poller):
+        """Test each tick checks is_available once per source, not again when polling."""
+
+        class CountingSource(MockMusicSource):
+            checks = 0
+
+            @property
+            def is_available(self) -> bool:
+                self.checks += 1
+                return self._available
+
+        mock_sonos = CountingSource("sonos", available=True, track=make_track("sonos"))
+
+        mock_settings = make_settings(interval=0.01)
+
+        poller = bare_poller([mock_sonos], running=True)
+
+        with patch("album_art.services.poller.get_settings", return_value=mock_settings):
+            with patch("album_art.services.poller.playback_state", PlaybackState()):
+                poller._task = asyncio.create_task(poller._poll_loop())
+                await asyncio.sleep(0.05)
+                poller._running = False
+                poller._stop_event.set()
+                await poller._task
+
+        assert mock_sonos._call_count >= 2
+        assert mock_sonos.checks == mock_sonos._call_count
+
+    async def test_poll_time_counts_toward_interval(self, bare_poller):
+        """Test ticks start an interval apart even when each poll takes a while."""
+        starts: list[float] = []
+
+        async def slow_poll_sources(timeout=None, sources=None):
+            starts.append(time.monotonic())
+            await asyncio.sleep(0.03)
+            return make_track("sonos")
+
+        poller = bare_poller([MockMusicSource("sonos", available=True)], running=True)
+
+        with patch("album_art.services.poller.get_settings", return_value=make_settings(0.05)):
+            with patch.object(poller, "_poll_sources", new=slow_poll_sources):
+                with patch("album_art.services.poller.playback_state", PlaybackState()):
+                    poller._task = asyncio.create_task(poller._poll_loop())
+                    await asyncio.sleep(0.22)
+                    poller._running = False
+                    poller._stop_event.set()
+                    await poller._task
+
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        assert len(gaps) >= 3
+        # Poll + a full interval would be 0.08s apart
+        assert max(gaps) < 0.07
+
+    async def test_unchanged_track_notifies_once(self, bare_poller):
+        """Test subscribers hear about each distinct track once, not every poll."""
+        poll_count = 0
+
+        async def changing_track():
+            nonlocal poll_count
+            poll_count += 1
+            # A fresh object every poll, as real sources return
+            return make_track("sonos", title="First" if poll_count <= 3 else "Second")
+
+        mock_sonos = MockMusicSource("sonos", available=True)
+        mock_sonos.get_current_track = changing_track
+
+        state = PlaybackState()
+        notified: list[str] = []
+
+        async def record(track):
+            notified.append(track.title)
+
+        state.subscribe(record)
+
+        poller = bare_poller([mock_sonos], running=True)
+
+        with patch("album_art.services.poller.get_settings", return_value=make_settings(0.01)):
+            with patch("album_art.services.poller.playback_state", state):
+                poller._task = asyncio.create_task(poller._poll_loop())
+                await asyncio.sleep(0.1)
+                poller._running = False
+                poller._stop_event.set()
+                await poller._task
+        await asyncio.sleep(0)
+
+        assert poll_count > 4
+        assert notified == ["First", "Second"]
+
 
 class TestPollerConcurrency:
     """Test concurrent source polling behavior."""
 
-    @pytest.mark.asyncio
-    async def test_sources_polled_concurrently(self):
+    async def test_sources_polled_concurrently(self, bare_poller):
         """Test that sources are polled concurrently, not sequentially."""
         call_times = []
 
         async def slow_get_track(delay: float, source: str):
-            call_times.append((source, "start", asyncio.get_event_loop().time()))
+            call_times.append((source, "start", time.monotonic()))
             await asyncio.sleep(delay)
-            call_times.append((source, "end", asyncio.get_event_loop().time()))
+            call_times.append((source, "end", time.monotonic()))
             return make_track(source)
 
         mock_sonos = MockMusicSource("sonos", available=True)
@@ -340,14 +523,11 @@ class TestPollerConcurrency:
         mock_sonos.get_current_track = lambda: slow_get_track(0.05, "sonos")
         mock_spotify.get_current_track = lambda: slow_get_track(0.05, "spotify")
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
-        start = asyncio.get_event_loop().time()
+        start = time.monotonic()
         result = await poller._poll_sources()
-        elapsed = asyncio.get_event_loop().time() - start
+        elapsed = time.monotonic() - start
 
         # If concurrent, should take ~0.05s, not ~0.10s
         assert elapsed < 0.08  # Some buffer for overhead
@@ -358,8 +538,7 @@ class TestPollerConcurrency:
         ends = [t for s, e, t in call_times if e == "end"]
         assert max(starts) < min(ends)
 
-    @pytest.mark.asyncio
-    async def test_slow_source_doesnt_block_fast_source(self):
+    async def test_slow_source_doesnt_block_fast_source(self, bare_poller):
         """Test slow failing source doesn't delay using fast successful source."""
 
         async def slow_failing_track():
@@ -376,16 +555,125 @@ class TestPollerConcurrency:
         mock_sonos.get_current_track = fast_successful_track
         mock_spotify.get_current_track = slow_failing_track
 
-        poller = Poller.__new__(Poller)
-        poller._sources = [mock_sonos, mock_spotify]
-        poller._running = False
-        poller._task = None
+        poller = bare_poller([mock_sonos, mock_spotify])
 
-        start = asyncio.get_event_loop().time()
+        start = time.monotonic()
         result = await poller._poll_sources()
-        elapsed = asyncio.get_event_loop().time() - start
+        elapsed = time.monotonic() - start
 
-        # Should still return result (need to wait for all due to gather)
+        # Spotify outranks Sonos, so its (failed) answer is still waited for
+        assert result is not None
+        assert result.source == "sonos"
+
+    async def test_top_priority_playing_cancels_slower_sources(self, bare_poller):
+        """Test a playing Spotify track is returned without waiting for Sonos."""
+        sonos_cancelled = False
+
+        async def slow_track():
+            nonlocal sonos_cancelled
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                sonos_cancelled = True
+                raise
+            return make_track("sonos")
+
+        mock_sonos = MockMusicSource("sonos", available=True)
+        mock_sonos.get_current_track = slow_track
+        mock_spotify = MockMusicSource("spotify", available=True, track=make_track("spotify"))
+
+        poller = bare_poller([mock_sonos, mock_spotify])
+
+        start = time.monotonic()
+        result = await poller._poll_sources()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.5
+        assert result.source == "spotify"
+        assert sonos_cancelled
+
+    async def test_cancelled_sonos_poll_still_caches_itunes_art(
+        self, bare_poller, mock_settings, mock_soco_device, itunes_api
+    ):
+        """Test an iTunes search survives the outranked Sonos poll being cancelled."""
+        mock_soco_device.transport_info = {"current_transport_state": "PAUSED_PLAYBACK"}
+        itunes_api.latency = 0.2
+        itunes_api.respond([
+            {
+                "artistName": "Test Artist",
+                "collectionName": "Test Album",
+                "artworkUrl100": "http://example.com/100x100bb.jpg",
+            }
+        ])
+
+        async def quick_track():
+            await asyncio.sleep(0.05)
+            return make_track("spotify")
+
+        mock_spotify = MockMusicSource("spotify", available=True)
+        mock_spotify.get_current_track = quick_track
+
+        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
+            sonos_source = SonosSource()
+            sonos_source._get_device()
+            await sonos_source._discovery
+            poller = bare_poller([mock_spotify, sonos_source])
+            for _ in range(6):
+                result = await poller._poll_sources()
+                assert result.source == "spotify"
+            # Every poll cancelled Sonos mid-search; the search itself carried on
+            await asyncio.gather(*itunes._inflight.values())
+
+        assert len(itunes_api.requests) == 1
+        assert itunes._artwork_cache
+
+    async def test_sonos_discovery_longer_than_poll_timeout(
+        self, bare_poller, mock_settings, mock_soco_device
+    ):
+        """Test Sonos discovery outlasting a poll isn't counted as a source failure."""
+
+        def slow_connect(ip):
+            time.sleep(0.15)  # several 0.04s poll timeouts
+            return mock_soco_device
+
+        state = PlaybackState()
+
+        with patch("album_art.sources.sonos.SoCo", side_effect=slow_connect) as soco:
+            sonos_source = SonosSource()
+            poller = bare_poller([sonos_source], running=True)
+            with patch(
+                "album_art.services.poller.get_settings", return_value=make_settings(0.05)
+            ):
+                with patch("album_art.services.poller.playback_state", state):
+                    poller._task = asyncio.create_task(poller._poll_loop())
+                    await asyncio.sleep(0.6)
+                    poller._running = False
+                    poller._stop_event.set()
+                    await poller._task
+
+        soco.assert_called_once()
+        assert poller._source_failures == {}
+        assert poller._source_retry_at == {}
+        assert state.current_track.source == "sonos"
+
+    async def test_hung_source_times_out(self, bare_poller):
+        """Test a source that never answers is dropped after the poll timeout."""
+
+        async def hung_track():
+            await asyncio.sleep(10)
+            return make_track("spotify")
+
+        mock_sonos = MockMusicSource("sonos", available=True, track=make_track("sonos"))
+        mock_spotify = MockMusicSource("spotify", available=True)
+        mock_spotify.get_current_track = hung_track
+
+        poller = bare_poller([mock_sonos, mock_spotify])
+
+        start = time.monotonic()
+        result = await poller._poll_sources(timeout=0.05)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 1.0
         assert result is not None
         assert result.source == "sonos"
 
@@ -393,13 +681,9 @@ class TestPollerConcurrency:
 class TestPollerStartStop:
     """Test poller start/stop lifecycle."""
 
-    @pytest.mark.asyncio
     async def test_start_creates_task(self):
         """Test starting poller creates background task."""
-        mock_settings = MagicMock()
-        mock_settings.sonos.enabled = False
-        mock_settings.spotify.enabled = False
-        mock_settings.polling.interval = 1.0
+        mock_settings = make_settings()
 
         with patch("album_art.services.poller.get_settings", return_value=mock_settings):
             poller = Poller()
@@ -412,13 +696,9 @@ class TestPollerStartStop:
             await poller.stop()
             assert poller._running is False
 
-    @pytest.mark.asyncio
     async def test_stop_cancels_task(self):
         """Test stopping poller cancels the polling task."""
-        mock_settings = MagicMock()
-        mock_settings.sonos.enabled = False
-        mock_settings.spotify.enabled = False
-        mock_settings.polling.interval = 0.01
+        mock_settings = make_settings(interval=0.01)
 
         with patch("album_art.services.poller.get_settings", return_value=mock_settings):
             poller = Poller()
@@ -431,30 +711,29 @@ class TestPollerStartStop:
             await poller.stop()
             assert task.done() or task.cancelled()
 
-    @pytest.mark.asyncio
     async def test_double_start_is_idempotent(self):
         """Test calling start twice doesn't create duplicate tasks."""
-        mock_settings = MagicMock()
-        mock_settings.sonos.enabled = False
-        mock_settings.spotify.enabled = False
-        mock_settings.polling.interval = 1.0
+        mock_settings = make_settings()
 
-        with patch("album_art.services.poller.get_settings", return_value=mock_settings):
+        with patch(
+            "album_art.services.poller.get_settings", return_value=mock_settings
+        ) as get_settings:
             poller = Poller()
             await poller.start()
             first_task = poller._task
+            await asyncio.sleep(0)  # Let the loop read its settings
+            settings_reads = get_settings.call_count
 
             await poller.start()
             assert poller._task is first_task  # Same task
+            # The no-op start returns before touching settings or sources
+            assert get_settings.call_count == settings_reads
 
             await poller.stop()
 
-    @pytest.mark.asyncio
     async def test_stop_without_start(self):
         """Test stopping without starting doesn't raise."""
-        mock_settings = MagicMock()
-        mock_settings.sonos.enabled = False
-        mock_settings.spotify.enabled = False
+        mock_settings = make_settings()
 
         with patch("album_art.services.poller.get_settings", return_value=mock_settings):
             poller = Poller()
@@ -8,63 +8,96 @@ These tests verify the application handles various network issues gracefully:
 - Queue fetch failures
 """
 
-import asyncio
 import socket
-from unittest.mock import MagicMock, patch, AsyncMock, PropertyMock
+import time
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import soco
-from soco import SoCo
 from soco.exceptions import SoCoException
 
+from album_art.sources import sonos
 from album_art.sources.sonos import SonosSource
 
+# Shared, read-only track info payloads returned by the mock device
+_TRACK_INFO_OK = {
+    "title": "Test Song",
+    "artist": "Test Artist",
+    "album": "Test Album",
+    "album_art": "/art.jpg",
+    "position": "1:00",
+    "duration": "3:00",
+}
+_TRACK_INFO_EMPTY = dict.fromkeys(_TRACK_INFO_OK, "")
+
+
+async def discover(source: SonosSource):
+    """Start the source's background discovery, wait for it and return the device."""
+    source._get_device()
+    await source._discovery
+    return source._device
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_soco(request):
+    """Patch SoCo once for the module; tests set its return_value or side_effect."""
+    p = patch.object(sonos, "SoCo")
+    m = p.start()
+    request.addfinalizer(p.stop)
+    return m
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_discover(request):
+    """Patch discovery once for the module so no test sends real multicast."""
+    p = patch.object(sonos.soco, "discover")
+    m = p.start()
+    request.addfinalizer(p.stop)
+    return m
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_itunes(request):
+    """Patch the iTunes lookup once for the module so no test hits the network."""
+    p = patch.object(sonos, "get_itunes_artwork", new_callable=AsyncMock)
+    m = p.start()
+    request.addfinalizer(p.stop)
+    return m
+
+
+@pytest.fixture(autouse=True)
+def reset_patches(patched_soco, patched_discover, patched_itunes):
+    """Give every test freshly configured module patches."""
+    for m in (patched_soco, patched_discover, patched_itunes):
+        m.reset_mock(return_value=True, side_effect=True)
+    patched_discover.return_value = None
+    patched_itunes.return_value = (None, "not found")
+
 
 class TestSonosDeviceConnection:
     """Test Sonos device connection scenarios."""
 
-    @pytest.mark.asyncio
-    async def test_device_unreachable_connection_refused(self, mock_settings):
-        """Test behavior when Sonos device refuses connection (device offline)."""
-        with patch("album_art.sources.sonos.SoCo") as mock_soco_class:
-            # Simulate connection refused error
-            mock_soco_class.side_effect = OSError(
-                111, "Connection refused"
-            )
-
-            # Also mock discovery to return nothing (so no fallback)
-            with patch("album_art.sources.sonos.soco.discover", return_value=None):
-                source = SonosSource()
-                assert not source.is_available
-                track = await source.get_current_track()
-                assert track is None
-
-    @pytest.mark.asyncio
-    async def test_device_unreachable_timeout(self, mock_settings):
-        """Test behavior when Sonos device times out (network unreachable)."""
-        with patch("album_art.sources.sonos.SoCo") as mock_soco_class:
-            # Simulate socket timeout
-            mock_soco_class.side_effect = socket.timeout("Connection timed out")
-
-            # Also mock discovery to return nothing (so no fallback)
-            with patch("album_art.sources.sonos.soco.discover", return_value=None):
-                source = SonosSource()
-                assert not source.is_available
-
-    @pytest.mark.asyncio
-    async def test_device_unreachable_host_unreachable(self, mock_settings):
-        """Test behavior when host is unreachable (network partition)."""
-        with patch("album_art.sources.sonos.SoCo") as mock_soco_class:
-            # Simulate no route to host
-            mock_soco_class.side_effect = OSError(113, "No route to host")
-
-            # Also mock discovery to return nothing
-            with patch("album_art.sources.sonos.soco.discover", return_value=None):
-                source = SonosSource()
-                assert not source.is_available
-
-    @pytest.mark.asyncio
-    async def test_invalid_device_at_ip(self, mock_settings):
+    @pytest.mark.parametrize(
+        "exc",
+        [
+            OSError(111, "Connection refused"),  # Device offline
+            socket.timeout("Connection timed out"),  # Network unreachable
+            OSError(113, "No route to host"),  # Network partition
+        ],
+        ids=["connection_refused", "timeout", "host_unreachable"],
+    )
+    async def test_device_unreachable(self, mock_settings, patched_soco, exc):
+        """Test behavior when the configured Sonos device can't be reached."""
+        # Discovery finds nothing, so there's no fallback
+        patched_soco.side_effect = exc
+
+        source = SonosSource()
+        assert await discover(source) is None
+        assert not source.is_available
+        track = await source.get_current_track()
+        assert track is None
+
+    async def test_invalid_device_at_ip(self, mock_settings, patched_soco):
         """Test behavior when IP points to non-Sonos device (validation fails)."""
 
         # Create a fake device class that raises on uid access
@@ -75,80 +108,58 @@ class TestSonosDeviceConnection:
             def uid(self):
                 raise AttributeError("Device has no 'uid' attribute")
 
-        with patch("album_art.sources.sonos.SoCo", return_value=FakeNonSonosDevice()):
-            # Also mock discovery to return nothing (so no fallback)
-            with patch("album_art.sources.sonos.soco.discover", return_value=None):
-                source = SonosSource()
-                # Should fail validation since uid access fails
-                assert not source.is_available
+        patched_soco.return_value = FakeNonSonosDevice()
+
+        source = SonosSource()
+        # Should fail validation since uid access fails
+        assert await discover(source) is None
+        assert not source.is_available
 
-    @pytest.mark.asyncio
-    async def test_valid_device_connection(self, mock_settings, mock_soco_device):
+    async def test_valid_device_connection(self, mock_settings, mock_soco_device, patched_soco):
         """Test successful connection to valid Sonos device."""
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            source = SonosSource()
-            assert source.is_available
-            assert source._room_name == "Living Room"
+        patched_soco.return_value = mock_soco_device
+
+        source = SonosSource()
+        assert await discover(source) is mock_soco_device
+        assert source.is_available
+        assert source._room_name == "Living Room"
 
 
 class TestSonosPollingFailures:
     """Test failures during active polling."""
 
-    @pytest.mark.asyncio
-    async def test_disconnect_during_track_info_fetch(self, mock_settings, mock_soco_device):
-        """Test device disconnects while fetching track info."""
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            source = SonosSource()
-            assert source.is_available
-
-            # Now simulate disconnect on next poll
-            mock_soco_device.get_current_track_info.side_effect = OSError(
-                104, "Connection reset by peer"
-            )
-
-            track = await source.get_current_track()
-            assert track is None
-
-            # Verify device state was reset for retry
-            assert source._device is None
-            assert source._discovery_attempted is False
-
-    @pytest.mark.asyncio
-    async def test_disconnect_during_transport_info_fetch(
-        self, mock_settings, mock_soco_device
-    ):
-        """Test device disconnects while fetching transport info."""
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            source = SonosSource()
-            assert source.is_available
-
+    @pytest.mark.parametrize(
+        "response, exc",
+        [
+            ("track_info", OSError(104, "Connection reset by peer")),
             # Track info succeeds but transport info fails
-            mock_soco_device.get_current_transport_info.side_effect = socket.timeout(
-                "Read timed out"
-            )
-
-            track = await source.get_current_track()
-            assert track is None
-            assert source._device is None
+            ("transport_info", socket.timeout("Read timed out")),
+            # SoCo library can raise SoCoException for various issues
+            ("track_info", SoCoException("UPnP Error: Action failed")),
+        ],
+        ids=["track_info_disconnect", "transport_info_timeout", "soco_library_exception"],
+    )
+    async def test_failure_during_poll(
+        self, mock_settings, mock_soco_device, patched_soco, response, exc
+    ):
+        """Test the device failing mid-poll returns no track and resets for retry."""
+        patched_soco.return_value = mock_soco_device
+        source = SonosSource()
+        assert await discover(source) is mock_soco_device
 
-    @pytest.mark.asyncio
-    async def test_soco_library_exception(self, mock_settings, mock_soco_device):
-        """Test SoCo library-specific exceptions are handled."""
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            source = SonosSource()
-            assert source.is_available
+        # Now simulate the failure on next poll
+        setattr(mock_soco_device, response, exc)
 
-            # SoCo library can raise SoCoException for various issues
-            mock_soco_device.get_current_track_info.side_effect = SoCoException(
-                "UPnP Error: Action failed"
-            )
+        track = await source.get_current_track()
+        assert track is None
 
-            track = await source.get_current_track()
-            assert track is None
-            assert source._device is None
+        # Verify device state was reset for retry
+        assert source._device is None
+        assert source._discovery is None
 
-    @pytest.mark.asyncio
-    async def test_intermittent_failure_recovery(self, mock_settings, mock_soco_device):
+    async def test_intermittent_failure_recovery(
+        self, mock_settings, mock_soco_device, patched_soco
+    ):
         """Test recovery from intermittent network failures."""
         call_count = 0
 
@@ -157,226 +168,460 @@ class TestSonosPollingFailures:
             call_count += 1
             if call_count == 2:
                 raise OSError(104, "Connection reset by peer")
-            return {
-                "title": "Test Song",
-                "artist": "Test Artist",
-                "album": "Test Album",
-                "album_art": "/art.jpg",
-                "position": "1:00",
-                "duration": "3:00",
-            }
+            return _TRACK_INFO_OK
 
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            with patch("album_art.sources.sonos.get_itunes_artwork", return_value=None):
-                source = SonosSource()
-                mock_soco_device.get_current_track_info.side_effect = intermittent_failure
+        patched_soco.return_value = mock_soco_device
+        source = SonosSource()
+        await discover(source)
+        mock_soco_device.track_info = intermittent_failure
 
-                # First call succeeds
-                track1 = await source.get_current_track()
-                assert track1 is not None
-                assert track1.title == "Test Song"
+        # First call succeeds
+        track1 = await source.get_current_track()
+        assert track1 is not None
+        assert track1.title == "Test Song"
 
-                # Second call fails (intermittent)
-                track2 = await source.get_current_track()
-                assert track2 is None
+        # Second call fails (intermittent)
+        track2 = await source.get_current_track()
+        assert track2 is None
 
-                # Device was reset, would need to reconnect
-                assert source._device is None
+        # Device was reset, would need to reconnect
+        assert source._device is None
 
 
 class TestSonosAutoDiscovery:
     """Test Sonos auto-discovery scenarios."""
 
-    @pytest.mark.asyncio
     async def test_discovery_timeout(self, test_settings):
         """Test behavior when Sonos discovery times out."""
-        test_settings.sonos.ip = ""  # Force discovery
+        test_settings = replace(test_settings, sonos=replace(test_settings.sonos, ip=""))
 
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch("album_art.sources.sonos.soco.discover", return_value=None):
-                source = SonosSource()
-                assert not source.is_available
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            assert await discover(source) is None
+            assert not source.is_available
 
-    @pytest.mark.asyncio
-    async def test_discovery_no_devices_found(self, test_settings):
+    async def test_discovery_no_devices_found(self, test_settings, patched_discover):
         """Test behavior when discovery finds no devices."""
-        test_settings.sonos.ip = ""
+        test_settings = replace(test_settings, sonos=replace(test_settings.sonos, ip=""))
+        patched_discover.return_value = []
 
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch("album_art.sources.sonos.soco.discover", return_value=[]):
-                source = SonosSource()
-                assert not source.is_available
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            assert await discover(source) is None
+            assert not source.is_available
 
-    @pytest.mark.asyncio
-    async def test_discovery_network_error(self, test_settings):
+    async def test_discovery_network_error(self, test_settings, patched_discover):
         """Test behavior when discovery encounters network error."""
-        test_settings.sonos.ip = ""
-
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch(
-                "album_art.sources.sonos.soco.discover",
-                side_effect=OSError("Network is unreachable"),
-            ):
-                source = SonosSource()
-                assert not source.is_available
-
-    @pytest.mark.asyncio
-    async def test_discovery_finds_device(self, test_settings, mock_soco_device):
+        test_settings = replace(test_settings, sonos=replace(test_settings.sonos, ip=""))
+        patched_discover.side_effect = OSError("Network is unreachable")
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            assert await discover(source) is None
+            assert not source.is_available
+
+    async def test_discovery_finds_device(self, test_settings, mock_soco_device, patched_discover):
         """Test successful auto-discovery."""
-        test_settings.sonos.ip = ""
-
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch(
-                "album_art.sources.sonos.soco.discover", return_value=[mock_soco_device]
-            ):
-                source = SonosSource()
-                assert source.is_available
-                assert source._room_name == "Living Room"
-
-    @pytest.mark.asyncio
-    async def test_discovery_room_filter_not_found(self, test_settings, mock_soco_device):
+        test_settings = replace(test_settings, sonos=replace(test_settings.sonos, ip=""))
+        patched_discover.return_value = [mock_soco_device]
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            assert await discover(source) is mock_soco_device
+            assert source.is_available
+            assert source._room_name == "Living Room"
+
+    async def test_discovery_runs_in_background(
+        self, test_settings, mock_soco_device, patched_discover
+    ):
+        """Test is_available starts discovery once and reports False until it finds a speaker."""
+        test_settings = replace(test_settings, sonos=replace(test_settings.sonos, ip=""))
+
+        def slow_discover(timeout):
+            time.sleep(0.05)
+            return [mock_soco_device]
+
+        patched_discover.side_effect = slow_discover
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            start = time.monotonic()
+            assert not source.is_available
+            assert not source.is_available
+            # Neither read waited on the discovery thread
+            assert time.monotonic() - start < 0.04
+
+            await source._discovery
+            assert source.is_available
+
+        patched_discover.assert_called_once()
+
+    async def test_poll_during_discovery_returns_none(
+        self, test_settings, mock_soco_device, patched_discover
+    ):
+        """Test a poll doesn't wait for discovery, and polls normally once it's done."""
+        test_settings = replace(test_settings, sonos=replace(test_settings.sonos, ip=""))
+
+        def slow_discover(timeout):
+            time.sleep(0.05)
+            return [mock_soco_device]
+
+        patched_discover.side_effect = slow_discover
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            assert await source.get_current_track() is None
+            await source._discovery
+            track = await source.get_current_track()
+
+        assert track.title == "Test Song"
+        patched_discover.assert_called_once()
+
+    async def test_discovery_retries_with_longer_timeout(
+        self, test_settings, mock_soco_device, patched_discover
+    ):
+        """Test a quick discovery pass is followed by a longer one only if empty."""
+        test_settings = replace(test_settings, sonos=replace(test_settings.sonos, ip=""))
+        patched_discover.side_effect = [None, [mock_soco_device]]
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            assert await discover(source) is mock_soco_device
+            assert source.is_available
+            timeouts = [c.kwargs["timeout"] for c in patched_discover.call_args_list]
+            assert timeouts == [0.5, 5.0]
+
+    async def test_discovery_room_filter_not_found(
+        self, test_settings, mock_soco_device, patched_discover
+    ):
         """Test discovery with room filter that doesn't match."""
-        test_settings.sonos.ip = ""
-        test_settings.sonos.room = "Bedroom"  # Different from "Living Room"
-
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch(
-                "album_art.sources.sonos.soco.discover", return_value=[mock_soco_device]
-            ):
-                source = SonosSource()
-                # Room filter didn't match, but should fall back to first device
-                assert source.is_available
-
-    @pytest.mark.asyncio
-    async def test_fallback_to_discovery_after_ip_fails(self, test_settings, mock_soco_device):
+        test_settings = replace(
+            test_settings,
+            sonos=replace(test_settings.sonos, ip="", room="Bedroom"),  # Not "Living Room"
+        )
+        patched_discover.return_value = [mock_soco_device]
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            # Room filter didn't match, but should fall back to first device
+            assert await discover(source) is mock_soco_device
+
+    async def test_fallback_to_discovery_after_ip_fails(
+        self, test_settings, mock_soco_device, patched_soco, patched_discover
+    ):
         """Test fallback to discovery when configured IP fails."""
-        test_settings.sonos.ip = "192.168.1.99"  # Bad IP
-
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch("album_art.sources.sonos.SoCo") as mock_soco_class:
-                # First call with bad IP fails
-                mock_soco_class.side_effect = [
-                    OSError("Connection refused"),
-                    mock_soco_device,  # Discovery would return this
-                ]
-                with patch(
-                    "album_art.sources.sonos.soco.discover", return_value=[mock_soco_device]
-                ):
-                    source = SonosSource()
-                    # Should fall back to discovery
-                    assert source.is_available
+        test_settings = replace(
+            test_settings, sonos=replace(test_settings.sonos, ip="192.168.1.99")  # Bad IP
+        )
+        # First call with bad IP fails
+        patched_soco.side_effect = [
+            OSError("Connection refused"),
+            mock_soco_device,  # Discovery would return this
+        ]
+        patched_discover.return_value = [mock_soco_device]
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            # Should fall back to discovery
+            assert await discover(source) is mock_soco_device
+
+    async def test_discovered_device_cached_and_reused(
+        self, test_settings, mock_soco_device, tmp_path, patched_soco, patched_discover
+    ):
+        """Test a discovered speaker is saved and reused on the next start without discovery."""
+        cache_path = tmp_path / "sonos_cache"
+        test_settings = replace(
+            test_settings, sonos=replace(test_settings.sonos, ip="", cache_path=str(cache_path))
+        )
+        patched_discover.return_value = [mock_soco_device]
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            assert await discover(SonosSource()) is mock_soco_device
+
+            assert cache_path.exists()
+
+            patched_soco.return_value = mock_soco_device
+            patched_discover.reset_mock()
+            source = SonosSource()
+            assert await discover(source) is mock_soco_device
+            assert source.is_available
+            assert source._room_name == "Living Room"
+            patched_discover.assert_not_called()
+
+    async def test_cached_device_with_different_uid_rediscovers(
+        self, test_settings, mock_soco_device, tmp_path, patched_soco, patched_discover
+    ):
+        """Test a cached IP now answered by a different speaker falls back to discovery."""
+        cache_path = tmp_path / "sonos_cache"
+        cache_path.write_text(
+            '{"ip": "192.168.1.50", "uid": "RINCON_OLD", "room": "Living Room"}'
+        )
+        test_settings = replace(
+            test_settings, sonos=replace(test_settings.sonos, ip="", cache_path=str(cache_path))
+        )
+        patched_soco.return_value = mock_soco_device
+        patched_discover.return_value = [mock_soco_device]
+
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            assert await discover(source) is mock_soco_device
+            assert source.is_available
+            patched_discover.assert_called_once()
 
 
 class TestSonosQueueFetch:
     """Test Sonos queue fetching for prefetch feature."""
 
-    @pytest.mark.asyncio
-    async def test_queue_fetch_timeout(self, mock_settings, mock_soco_device):
+    async def test_queue_fetch_timeout(self, mock_settings, mock_soco_device, patched_soco):
         """Test queue fetch gracefully handles timeout."""
-        mock_soco_device.get_queue.side_effect = socket.timeout("Read timed out")
+        mock_soco_device.queue = socket.timeout("Read timed out")
+        patched_soco.return_value = mock_soco_device
 
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            with patch("album_art.sources.sonos.get_itunes_artwork", return_value=None):
-                source = SonosSource()
-                track = await source.get_current_track()
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
 
-                # Track info should still be returned
-                assert track is not None
-                # But upcoming_art_urls should be empty due to queue failure
-                assert track.upcoming_art_urls == []
+        # Track info should still be returned
+        assert track is not None
+        # But upcoming_art_urls should be empty due to queue failure
+        assert track.upcoming_art_urls == []
 
-    @pytest.mark.asyncio
-    async def test_queue_fetch_connection_error(self, mock_settings, mock_soco_device):
+    async def test_queue_fetch_connection_error(
+        self, mock_settings, mock_soco_device, patched_soco
+    ):
         """Test queue fetch handles connection errors."""
-        mock_soco_device.get_queue.side_effect = OSError("Connection reset")
+        mock_soco_device.queue = OSError("Connection reset")
+        patched_soco.return_value = mock_soco_device
 
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            with patch("album_art.sources.sonos.get_itunes_artwork", return_value=None):
-                source = SonosSource()
-                track = await source.get_current_track()
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
 
-                assert track is not None
-                assert track.upcoming_art_urls == []
+        assert track is not None
+        assert track.upcoming_art_urls == []
 
-    @pytest.mark.asyncio
-    async def test_queue_fetch_success(self, mock_settings, mock_soco_device, mock_queue_items):
+    async def test_queue_fetch_success(
+        self, mock_settings, mock_soco_device, mock_queue_items, patched_soco
+    ):
         """Test successful queue fetch returns artwork URLs."""
-        mock_soco_device.get_queue.return_value = mock_queue_items
+        mock_soco_device.queue = mock_queue_items
+        patched_soco.return_value = mock_soco_device
 
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            with patch("album_art.sources.sonos.get_itunes_artwork", return_value=None):
-                source = SonosSource()
-                track = await source.get_current_track()
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
 
-                assert track is not None
-                # Should have 3 URLs (one item had None)
-                assert len(track.upcoming_art_urls) == 3
+        assert track is not None
+        # Should have 3 URLs (one item had None)
+        assert len(track.upcoming_art_urls) == 3
 
-    @pytest.mark.asyncio
-    async def test_queue_fetch_disabled(self, test_settings, mock_soco_device):
+    async def test_queue_reused_until_track_changes(
+        self, mock_settings_no_itunes, mock_soco_device, mock_queue_items, patched_soco
+    ):
+        """Test the queue is only re-fetched when the current track changes."""
+        mock_soco_device.queue = mock_queue_items
+        track_info = mock_soco_device.track_info
+        track_info.update(uri="x-sonos-spotify:track1", playlist_position="1")
+        patched_soco.return_value = mock_soco_device
+
+        source = SonosSource()
+        await discover(source)
+        first = await source.get_current_track()
+        second = await source.get_current_track()
+        assert mock_soco_device.queue_calls == 1
+        assert second.upcoming_art_urls == first.upcoming_art_urls
+
+        track_info.update(uri="x-sonos-spotify:track2", playlist_position="2")
+        await source.get_current_track()
+        assert mock_soco_device.queue_calls == 2
+
+    async def test_queue_lookups_deduplicated_by_album(
+        self, mock_settings, mock_soco_device, patched_soco, patched_itunes
+    ):
+        """Test queue tracks from the same album share one iTunes lookup."""
+        queue = []
+        for title, album in [("A", "Album 1"), ("B", "Album 1"), ("C", "Album 2")]:
+            item = MagicMock(album_art_uri="http://sonos/art.jpg", title=title, album=album)
+            item.creator = "Test Artist"
+            queue.append(item)
+        mock_soco_device.queue = queue
+        patched_soco.return_value = mock_soco_device
+        patched_itunes.return_value = ("http://itunes/art.jpg", "matched")
+
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
+
+        # Current track + two distinct queue albums
+        assert patched_itunes.await_count == 3
+        assert all(item.has_itunes_match for item in track.upcoming_queue_items)
+
+    async def test_same_track_reuses_resolved_art(
+        self, mock_settings, mock_soco_device, patched_soco, patched_itunes
+    ):
+        """Test polls within one track skip the iTunes lookups but track position."""
+        track_info = mock_soco_device.track_info
+        patched_soco.return_value = mock_soco_device
+        patched_itunes.return_value = ("http://itunes/art.jpg", "matched")
+
+        source = SonosSource()
+        await discover(source)
+        await source.get_current_track()
+        track_info["position"] = "1:05"
+        track = await source.get_current_track()
+
+        assert patched_itunes.await_count == 1
+        assert track.album_art_url == "http://itunes/art.jpg"
+        assert track.position_ms == 65000
+
+        # A transient failure isn't kept - the next poll tries again
+        track_info["title"] = "Other Song"
+        patched_itunes.return_value = (None, "rate limited")
+        await source.get_current_track()
+        await source.get_current_track()
+        assert patched_itunes.await_count == 3
+
+    async def test_resuming_playback_re_resolves(
+        self, mock_settings_no_itunes, mock_soco_device, mock_queue_items, patched_soco
+    ):
+        """Test play -> pause -> play re-fetches the queue, in case it was edited."""
+        mock_soco_device.queue = mock_queue_items
+        mock_soco_device.track_info.update(uri="x-sonos-spotify:track1", playlist_position="1")
+        patched_soco.return_value = mock_soco_device
+
+        source = SonosSource()
+        await discover(source)
+        await source.get_current_track()
+        mock_soco_device.transport_info = {"current_transport_state": "PAUSED_PLAYBACK"}
+        paused = await source.get_current_track()
+        assert paused.is_playing is False
+        assert mock_soco_device.queue_calls == 1
+
+        mock_soco_device.transport_info = {"current_transport_state": "PLAYING"}
+        resumed = await source.get_current_track()
+        assert resumed.is_playing is True
+        assert mock_soco_device.queue_calls == 2
+
+        # Still playing - back to reusing the resolved track
+        await source.get_current_track()
+        assert mock_soco_device.queue_calls == 2
+
+    async def test_failed_queue_lookup_isolated(
+        self, mock_settings, mock_soco_device, patched_soco, patched_itunes
+    ):
+        """Test one queue lookup raising doesn't drop the others' results."""
+        queue = []
+        for album in ("Good Album", "Bad Album"):
+            item = MagicMock(album_art_uri="http://sonos/art.jpg", title="T", album=album)
+            item.creator = "Test Artist"
+            queue.append(item)
+        mock_soco_device.queue = queue
+
+        async def lookup(artist, album):
+            if album == "Bad Album":
+                raise RuntimeError("boom")
+            return "http://itunes/art.jpg", "matched"
+
+        patched_soco.return_value = mock_soco_device
+        patched_itunes.side_effect = lookup
+
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
+
+        good, bad = track.upcoming_queue_items
+        assert good.has_itunes_match
+        assert not bad.has_itunes_match
+        assert bad.reason == "error"
+
+    async def test_missing_album_skips_itunes(
+        self, mock_settings, mock_soco_device, patched_soco, patched_itunes
+    ):
+        """Test a track with no album (e.g. radio) doesn't spend an iTunes lookup."""
+        mock_soco_device.track_info["album"] = ""
+        patched_soco.return_value = mock_soco_device
+        patched_itunes.return_value = ("http://itunes/art.jpg", "matched")
+
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
+
+        patched_itunes.assert_not_awaited()
+        assert track.album == "Unknown Album"
+        assert track.art_source == "sonos"
+        assert track.art_source_reason == "no metadata"
+
+    async def test_queue_fetch_disabled(self, test_settings, mock_soco_device, patched_soco):
         """Test queue prefetch is skipped when prefetch_count is 0."""
-        test_settings.artwork.prefetch_count = 0
+        test_settings = replace(
+            test_settings, artwork=replace(test_settings.artwork, prefetch_count=0)
+        )
+        patched_soco.return_value = mock_soco_device
 
-        with patch("album_art.sources.sonos.get_settings", return_value=test_settings):
-            with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-                with patch("album_art.sources.sonos.get_itunes_artwork", return_value=None):
-                    source = SonosSource()
-                    track = await source.get_current_track()
+        with patch.object(sonos, "get_settings", return_value=test_settings):
+            source = SonosSource()
+            await discover(source)
+            track = await source.get_current_track()
 
-                    assert track is not None
-                    assert track.upcoming_art_urls == []
-                    # Queue should not be called at all
-                    mock_soco_device.get_queue.assert_not_called()
+            assert track is not None
+            assert track.upcoming_art_urls == []
+            # Queue should not be called at all
+            assert mock_soco_device.queue_calls == 0
 
 
 class TestSonosPlaybackState:
     """Test correct handling of playback states."""
 
-    @pytest.mark.asyncio
-    async def test_paused_state(self, mock_settings, mock_soco_device):
-        """Test handling of PAUSED_PLAYBACK state."""
-        mock_soco_device.get_current_transport_info.return_value = {
-            "current_transport_state": "PAUSED_PLAYBACK"
-        }
-
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            with patch("album_art.sources.sonos.get_itunes_artwork", return_value=None):
-                source = SonosSource()
-                track = await source.get_current_track()
-
-                assert track is not None
-                assert track.is_playing is False
-
-    @pytest.mark.asyncio
-    async def test_stopped_state(self, mock_settings, mock_soco_device):
-        """Test handling of STOPPED state."""
-        mock_soco_device.get_current_transport_info.return_value = {
-            "current_transport_state": "STOPPED"
-        }
-
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            with patch("album_art.sources.sonos.get_itunes_artwork", return_value=None):
-                source = SonosSource()
-                track = await source.get_current_track()
-
-                assert track is not None
-                assert track.is_playing is False
-
-    @pytest.mark.asyncio
-    async def test_no_track_playing(self, mock_settings, mock_soco_device):
+    @pytest.mark.parametrize(
+        "state", ["PAUSED_PLAYBACK", "STOPPED", "TRANSITIONING", "NO_MEDIA_PRESENT"]
+    )
+    async def test_non_playing_state(self, mock_settings, mock_soco_device, patched_soco, state):
+        """Test any transport state other than PLAYING is reported as not playing."""
+        mock_soco_device.transport_info = {"current_transport_state": state}
+        patched_soco.return_value = mock_soco_device
+
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
+
+        assert track is not None
+        assert track.is_playing is False
+
+    async def test_no_track_playing(self, mock_settings, mock_soco_device, patched_soco):
         """Test handling when no track is playing (empty title)."""
-        mock_soco_device.get_current_track_info.return_value = {
-            "title": "",
-            "artist": "",
-            "album": "",
-            "album_art": "",
-            "position": "",
-            "duration": "",
-        }
-
-        with patch("album_art.sources.sonos.SoCo", return_value=mock_soco_device):
-            source = SonosSource()
-            track = await source.get_current_track()
+        mock_soco_device.track_info = _TRACK_INFO_EMPTY
+        patched_soco.return_value = mock_soco_device
+
+        source = SonosSource()
+        await discover(source)
+        track = await source.get_current_track()
+
+        # Should return None when title is empty
+        assert track is None
+
+
+class TestSonosTimeParsing:
+    """Test parsing of Sonos position/duration strings."""
+
+    def test_parse_hours_minutes_seconds(self):
+        """Test H:MM:SS format."""
+        assert SonosSource._parse_time("1:02:03") == 3723000
+
+    def test_parse_minutes_seconds(self):
+        """Test M:SS format."""
+        assert SonosSource._parse_time("3:21") == 201000
+
+    @pytest.mark.parametrize("time_str", ["", None])
+    def test_parse_empty(self, time_str):
+        """Test an empty or missing value returns None."""
+        assert SonosSource._parse_time(time_str) is None
+
+    def test_parse_not_implemented(self):
+        """Test non-numeric values (e.g. radio streams) return None."""
+        assert SonosSource._parse_time("NOT_IMPLEMENTED") is None
 
-            # Should return None when title is empty
-            assert track is None
+    def test_parse_malformed(self):
+        """Test malformed strings return None."""
+        assert SonosSource._parse_time("12") is None
+        assert SonosSource._parse_time("1::2") is None
+        assert SonosSource._parse_time("1:00:00:00") is None
@@ -0,0 +1,113 @@
+"""Tests for Spotify token handling.
+
+These tests verify the Spotify source:
+- Refreshes the access token ahead of expiry, outside Spotipy's own window
+- Holds off after a failed refresh instead of retrying every poll
+- Re-checks the token cache file only once its existence check has expired
+
+Spotipy is never reached: the auth manager and client are MagicMocks.
+"""
+
+import time
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from album_art.sources import spotify
+from album_art.sources.spotify import SpotifySource
+
+
+@pytest.fixture
+def spotify_settings(test_settings, tmp_path):
+    """Patch get_settings with Spotify enabled and a token cache under tmp_path."""
+    settings = replace(
+        test_settings,
+        spotify=replace(
+            test_settings.spotify,
+            enabled=True,
+            client_id="id",
+            client_secret="secret",
+            cache_path=str(tmp_path / "spotify_cache"),
+        ),
+    )
+    with patch.object(spotify, "get_settings", return_value=settings):
+        yield settings
+
+
+def make_source(expires_in: float) -> SpotifySource:
+    """A source with a connected client whose cached token expires in expires_in seconds."""
+    source = SpotifySource()
+    source._client = MagicMock()
+    source._client.current_playback.return_value = None
+    source._auth_manager = MagicMock()
+    expires_at = time.time() + expires_in
+    source._auth_manager.cache_handler.get_cached_token.return_value = {
+        "expires_at": expires_at,
+        "refresh_token": "refresh",
+    }
+    source._auth_manager.refresh_access_token.return_value = {
+        "expires_at": time.time() + 3600,
+        "refresh_token": "refresh",
+    }
+    source._token_expires_at = expires_at
+    return source
+
+
+class TestSpotifyTokenRefresh:
+    """Test the access token is refreshed alongside polls, ahead of expiry."""
+
+    async def test_refresh_inside_margin(self):
+        """Test a token with under five minutes left is refreshed during the poll."""
+        source = make_source(expires_in=200)
+
+        await source.get_current_track()
+
+        source._auth_manager.refresh_access_token.assert_called_once_with("refresh")
+        assert source._token_expires_at - time.time() > 3000
+
+    @pytest.mark.parametrize("expires_in", [30, 1000], ids=["spotipy_window", "not_due"])
+    async def test_no_refresh_outside_margin(self, expires_in):
+        """Test no refresh while far from expiry or inside Spotipy's own inline window."""
+        source = make_source(expires_in=expires_in)
+
+        await source.get_current_track()
+
+        source._auth_manager.refresh_access_token.assert_not_called()
+
+    async def test_failed_refresh_held_off(self):
+        """Test a failed refresh isn't retried until the retry delay has passed."""
+        source = make_source(expires_in=200)
+        source._auth_manager.refresh_access_token.side_effect = RuntimeError("invalid_grant")
+
+        check_token = source._auth_manager.cache_handler.get_cached_token
+
+        await source.get_current_track()
+        await source.get_current_track()
+        source._auth_manager.refresh_access_token.assert_called_once()
+        assert check_token.call_count == 1
+
+        # Once the retry delay has passed, the next poll checks the token again
+        later = time.time() + spotify._TOKEN_REFRESH_RETRY_DELAY + 1
+        with patch.object(spotify.time, "time", return_value=later):
+            await source.get_current_track()
+        assert check_token.call_count == 2
+
+
+class TestSpotifyAvailability:
+    """Test is_available's cached token file check."""
+
+    def test_token_file_check_cached_until_ttl(self, spotify_settings):
+        """Test the token cache appearing is only noticed once the check expires."""
+        source = SpotifySource()
+        now = time.monotonic()
+
+        with patch.object(spotify.time, "monotonic", return_value=now):
+            assert not source.is_available
+
+        open(spotify_settings.spotify.cache_path, "w").close()
+        with patch.object(spotify.time, "monotonic", return_value=now + 1):
+            assert not source.is_available
+        ttl_later = now + spotify._TOKEN_FILE_CHECK_TTL
+        with patch.object(spotify.time, "monotonic", return_value=ttl_later):
+            assert source.is_available